@@ -0,0 +1,310 @@
+"""Benchmarks of the msgpack serialization layer (threedi_models_simulations/utils/msgpack.py).
+
+Measures dumpb/loadb throughput and peak memory for fixed payloads, per handler
+and compression option, and stores the results as JSON to compare runs between commits:
+
+    python benchmarks/bench_msgpack.py --output before.json
+    python benchmarks/bench_msgpack.py --output after.json --compare before.json
+"""
+
+import argparse
+import dataclasses
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MSGPACK_MODULE_PATH = os.path.join(
+    REPO_DIR, "threedi_models_simulations", "utils", "msgpack.py"
+)
+SEED = 3
+
+
+def load_msgpack_module():
+    """Load utils/msgpack.py on its own, the plugin package requires QGIS."""
+    spec = importlib.util.spec_from_file_location(
+        "bench_msgpack_module", MSGPACK_MODULE_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+tm_msgpack = load_msgpack_module()
+
+
+@dataclasses.dataclass
+class BenchLateral:
+    id: int
+    offset: float
+    values: list
+    units: str
+
+
+@dataclasses.dataclass
+class BenchSimulation:
+    name: str
+    duration: int
+    laterals: list
+    tags: list
+
+
+tm_msgpack.register(BenchLateral)
+tm_msgpack.register(BenchSimulation)
+
+
+def make_payloads(scale: float) -> dict:
+    """Return fixed benchmark payloads, name -> (handler, payload, dumpb kwargs)."""
+    rng = np.random.default_rng(SEED)
+    nodes_count = int(500_000 * scale)
+    structured_count = int(200_000 * scale)
+    geometries_count = int(50_000 * scale)
+    datetimes_count = int(50_000 * scale)
+    simulations_count = int(200 * scale)
+
+    nodes_1d = {
+        "node_ids": np.arange(1, nodes_count + 1, dtype=np.int64),
+        "value": rng.uniform(-5.0, 5.0, nodes_count),
+    }
+    structured = np.zeros(
+        structured_count,
+        dtype=[("id", "<i4"), ("x", "<f8"), ("y", "<f8"), ("flag", "u1")],
+    )
+    structured["id"] = np.arange(structured_count)
+    structured["x"] = rng.uniform(0, 1e5, structured_count)
+    structured["y"] = rng.uniform(0, 1e5, structured_count)
+    structured["flag"] = rng.integers(0, 2, structured_count)
+    simulations = [
+        BenchSimulation(
+            name=f"simulation {i}",
+            duration=3600 * (i + 1),
+            laterals=[
+                BenchLateral(
+                    id=j,
+                    offset=float(j * 60),
+                    values=[[t * 60.0, float(t % 7)] for t in range(10)],
+                    units="m3/s",
+                )
+                for j in range(20)
+            ],
+            tags=["benchmark", str(i)],
+        )
+        for i in range(simulations_count)
+    ]
+    coordinates = rng.uniform(0, 1e5, (geometries_count, 2))
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    datetimes = [start + timedelta(seconds=int(s)) for s in range(datetimes_count)]
+
+    payloads = {
+        "nodes_1d": ("NumpyArrayHandler", nodes_1d, {}),
+        "nodes_1d_binary": ("NumpyRawArrayHandler", nodes_1d, {"use_binary": True}),
+        "structured_array": ("NumpyArrayHandler", structured, {}),
+        "structured_array_binary": (
+            "NumpyRawArrayHandler",
+            structured,
+            {"use_binary": True},
+        ),
+        "dataclasses": ("DataclassHandler", simulations, {}),
+        "dataclasses_schema": (
+            "SchemaDataclassHandler",
+            simulations,
+            {"use_schemas": True},
+        ),
+        "datetimes": ("DatetimeHandler", datetimes, {}),
+        "datetimes_binary": (
+            "BinaryDatetimeHandler",
+            datetimes,
+            {"use_binary": True},
+        ),
+    }
+    try:
+        import shapely
+
+        points = shapely.points(coordinates)
+        payloads["geometry_list"] = ("PointHandler", list(points), {})
+        payloads["geometry_array_binary"] = (
+            "GeometryArrayHandler",
+            points,
+            {"use_binary": True},
+        )
+    except ImportError:
+        pass
+    return payloads
+
+
+def compression_options() -> dict:
+    """Return compression option name -> dumpb kwargs."""
+    options = {
+        "uncompressed": {"do_compress": False},
+        "legacy-lz4": {},
+    }
+    for codec in getattr(tm_msgpack, "CODECS", {}):
+        options[codec] = {"codec": codec}
+    return options
+
+
+def best_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(scale: float, repeat: int, options: List[str] = None) -> list:
+    results = []
+    all_options = compression_options()
+    selected_options = {
+        name: kwargs
+        for name, kwargs in all_options.items()
+        if not options or name in options
+    }
+    for payload_name, (handler, payload, payload_kwargs) in make_payloads(
+        scale
+    ).items():
+        # Throughput is related to the uncompressed msgpack size of the payload
+        raw_size = len(tm_msgpack.dumpb(payload, do_compress=False, **payload_kwargs))
+        for option_name, option_kwargs in selected_options.items():
+            dump_kwargs = {**payload_kwargs, **option_kwargs}
+            load_kwargs = {
+                "do_decompress": option_kwargs.get("do_compress", True),
+                "use_schemas": payload_kwargs.get("use_schemas", False),
+            }
+            packed = tm_msgpack.dumpb(payload, **dump_kwargs)
+            dump_time = best_time(
+                lambda: tm_msgpack.dumpb(payload, **dump_kwargs), repeat
+            )
+            load_time = best_time(
+                lambda: tm_msgpack.loadb(packed, **load_kwargs), repeat
+            )
+            result = {
+                "payload": payload_name,
+                "handler": handler,
+                "compression": option_name,
+                "raw_size": raw_size,
+                "packed_size": len(packed),
+                "ratio": round(len(packed) / raw_size, 4),
+                "dumpb_time": dump_time,
+                "loadb_time": load_time,
+                "dumpb_mb_s": round(raw_size / dump_time / 1024**2, 2),
+                "loadb_mb_s": round(raw_size / load_time / 1024**2, 2),
+                "dumpb_peak_memory": peak_memory(
+                    lambda: tm_msgpack.dumpb(payload, **dump_kwargs)
+                ),
+                "loadb_peak_memory": peak_memory(
+                    lambda: tm_msgpack.loadb(packed, **load_kwargs)
+                ),
+            }
+            results.append(result)
+            print_result(result)
+    return results
+
+
+def print_result(result: dict, baseline: dict = None):
+    line = (
+        f"{result['payload']:<20} {result['compression']:<15} "
+        f"{result['packed_size'] / 1024**2:>9.2f} MB "
+        f"dumpb {result['dumpb_mb_s']:>9.2f} MB/s {result['dumpb_peak_memory'] / 1024**2:>8.2f} MB peak | "
+        f"loadb {result['loadb_mb_s']:>9.2f} MB/s {result['loadb_peak_memory'] / 1024**2:>8.2f} MB peak"
+    )
+    if baseline:
+        line += (
+            f" | dumpb x{result['dumpb_mb_s'] / baseline['dumpb_mb_s']:.2f}"
+            f" loadb x{result['loadb_mb_s'] / baseline['loadb_mb_s']:.2f}"
+        )
+    print(line)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def metadata(scale: float, repeat: int) -> dict:
+    versions = {"python": platform.python_version(), "numpy": np.__version__}
+    for package in ("msgpack", "lz4", "shapely", "zstandard"):
+        try:
+            module = importlib.import_module(package)
+            versions[package] = getattr(module, "__version__", None) or ".".join(
+                map(str, getattr(module, "version", ()))
+            )
+        except ImportError:
+            versions[package] = None
+    return {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "versions": versions,
+    }
+
+
+def compare(results: list, baseline_path: str):
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    baseline_results = {
+        (result["payload"], result["compression"]): result
+        for result in baseline["results"]
+    }
+    print(f"\nCompared to {baseline_path} ({baseline['meta'].get('commit')}):")
+    for result in results:
+        key = (result["payload"], result["compression"])
+        if key in baseline_results:
+            print_result(result, baseline_results[key])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output", default="bench_msgpack.json", help="JSON results path"
+    )
+    parser.add_argument("--compare", help="JSON results of the previous run")
+    parser.add_argument("--scale", type=float, default=1.0, help="Payload size factor")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    parser.add_argument(
+        "--compression",
+        action="append",
+        help="Compression option(s) to run, all by default",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scale, args.repeat, args.compression)
+    with open(args.output, "w") as output_file:
+        json.dump(
+            {"meta": metadata(args.scale, args.repeat), "results": results},
+            output_file,
+            indent=2,
+        )
+    print(f"\nResults saved in {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
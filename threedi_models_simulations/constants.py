@@ -15,10 +15,50 @@ MANAGEMENT_URL_PREFIX = "https://management."
 LIVE_URL_PREFIX = "https://www."
 DEFAULT_BASE_URL = "3di.live"
 DEFAULT_UPLOAD_TIMEOUT = 900
+POLL_INITIAL_INTERVAL = 1
+POLL_MAX_INTERVAL = 10
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.2
+SIMULATION_SUBMISSION_MAX_WORKERS = 4
+SIMULATION_BATCH_MAX_WORKERS = 3
 
 CACHE_PATH = os.path.join(PLUGIN_PATH, "_cached_data")
 DOWNLOAD_CHUNK_SIZE = 1024**2
 UPLOAD_CHUNK_SIZE = 1024**2
+UPLOAD_MAX_WORKERS = 3
+UPLOAD_RETRIES = 5
+UPLOAD_RETRY_BACKOFF = 5
+CHECKSUM_CHUNK_SIZE = 8 * 1024**2
+CHECKSUM_MAX_WORKERS = 4
+CHECKSUM_CACHE_PATH = os.path.join(CACHE_PATH, "checksums.json")
+ARCHIVES_CACHE_DIR = os.path.join(CACHE_PATH, "archives")
+ARCHIVES_CACHE_MAX_SIZE = 4 * 1024**3
+UPLOAD_STATES_DIR = os.path.join(CACHE_PATH, "uploads")
+INITIAL_WATERLEVELS_REGISTRY_PATH = os.path.join(
+    CACHE_PATH, "initial_waterlevels_registry.json"
+)
+DOWNLOAD_MAX_WORKERS = 4
+SEGMENTED_DOWNLOAD_THRESHOLD = 256 * 1024**2
+DOWNLOAD_SEGMENT_SIZE = 64 * 1024**2
+DOWNLOAD_SEGMENT_WORKERS = 4
+# Part sizes tried to verify multipart upload ETags ("<md5>-<parts>")
+MULTIPART_ETAG_PART_SIZES = tuple(
+    size * 1024**2 for size in (8, 5, 16, 15, 32, 64, 100, 128, 256, 512)
+)
+DOWNLOAD_MANIFEST_FILENAME = "download_manifest.json"
+RESULT_FILE_PRESETS = {
+    "All files": ["*"],
+    "Aggregated results": ["aggregate_results_3di.nc", "gridadmin.*"],
+    "Raw results": ["results_3di.nc", "gridadmin.*"],
+    "Water quality results": ["water_quality_results_3di.nc", "gridadmin.*"],
+    "Logs": ["log_files_sim_*.zip", "*.log"],
+    "Computational grid": ["gridadmin.*"],
+}
+TRANSFER_POOL_SIZE = 10
+TRANSFER_CONNECT_TIMEOUT = 15
+TRANSFER_READ_TIMEOUT = 60
+TRANSFER_RETRIES = 3
+TRANSFER_BACKOFF_FACTOR = 1
 MAX_SCHEMATISATION_MODELS = 3
 USER_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 API_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
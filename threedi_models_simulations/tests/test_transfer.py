@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from threedi_models_simulations.utils.transfer import (
+    TransferSourceChanged,
+    TransferVerificationError,
+    etag_matches,
+    segmented_download,
+)
+
+SEGMENT_SIZE = 64 * 1024
+PART_SIZE = 5 * 1024**2
+
+
+def multipart_etag(content: bytes, part_size: int) -> str:
+    parts = [content[i : i + part_size] for i in range(0, len(content), part_size)]
+    digests = b"".join(hashlib.md5(part).digest() for part in parts)
+    return f'"{hashlib.md5(digests).hexdigest()}-{len(parts)}"'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in of the file storage, serving server.content with Range support."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(dict(self.headers))
+            if (
+                server.change_after is not None
+                and len(server.requests) > server.change_after
+            ):
+                content, etag = server.changed_content, server.changed_etag
+            else:
+                content, etag = server.content, server.etag
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and not server.ignore_range and if_range in (None, etag):
+            start, end = (int(v) for v in range_header.split("=")[1].split("-"))
+            body = content[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+        else:
+            body = content
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.content = os.urandom(10 * SEGMENT_SIZE + 123)
+    httpd.etag = f'"{hashlib.md5(httpd.content).hexdigest()}"'
+    httpd.ignore_range = False
+    httpd.change_after = None
+    httpd.changed_content = bytes(reversed(httpd.content))
+    httpd.changed_etag = f'"{hashlib.md5(httpd.changed_content).hexdigest()}"'
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/results_3di.nc"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def download(server, file_path, etag=None):
+    return segmented_download(
+        server.url,
+        str(file_path),
+        len(server.content),
+        etag=etag,
+        segment_size=SEGMENT_SIZE,
+        max_workers=4,
+    )
+
+
+def test_segmented_download(server, tmp_path):
+    file_path = tmp_path / "results_3di.nc"
+    assert download(server, file_path, server.etag) == len(server.content)
+    assert file_path.read_bytes() == server.content
+    assert not os.path.exists(f"{file_path}.segments.json")
+    assert len(server.requests) == 11
+    assert all(request["If-Range"] == server.etag for request in server.requests)
+
+
+def test_segmented_download_resumes_missing_segments(server, tmp_path):
+    file_path = tmp_path / "results_3di.nc"
+    # Interrupted download, with first half of the segments finished
+    with open(file_path, "wb") as f:
+        f.write(server.content[: 5 * SEGMENT_SIZE])
+        f.truncate(len(server.content))
+    with open(f"{file_path}.segments.json", "w") as sidecar:
+        json.dump(
+            {
+                "size": len(server.content),
+                "etag": server.etag.strip('"'),
+                "segment_size": SEGMENT_SIZE,
+                "finished": [0, 1, 2, 3, 4],
+            },
+            sidecar,
+        )
+    download(server, file_path, server.etag)
+    assert file_path.read_bytes() == server.content
+    assert len(server.requests) == 6
+
+
+def test_segmented_download_multipart_etag(server, tmp_path):
+    server.content = os.urandom(PART_SIZE + SEGMENT_SIZE)
+    server.etag = multipart_etag(server.content, PART_SIZE)
+    file_path = tmp_path / "results_3di.nc"
+    download(server, file_path, server.etag)
+    assert etag_matches(str(file_path), server.etag) is True
+    assert (
+        etag_matches(
+            str(file_path), multipart_etag(b"0" * len(server.content), PART_SIZE)
+        )
+        is False
+    )
+
+
+def test_segmented_download_checksum_mismatch(server, tmp_path):
+    server.etag = f'"{hashlib.md5(b"other content").hexdigest()}"'
+    file_path = tmp_path / "results_3di.nc"
+    with pytest.raises(TransferVerificationError):
+        download(server, file_path, server.etag)
+    assert not os.path.exists(f"{file_path}.segments.json")
+
+
+def test_segmented_download_falls_back_to_single_stream(server, tmp_path):
+    server.ignore_range = True
+    file_path = tmp_path / "results_3di.nc"
+    download(server, file_path, server.etag)
+    assert file_path.read_bytes() == server.content
+    assert not os.path.exists(f"{file_path}.segments.json")
+    assert "Range" not in server.requests[-1]
+
+
+def test_segmented_download_source_changed(server, tmp_path):
+    server.change_after = 3
+    file_path = tmp_path / "results_3di.nc"
+    with pytest.raises(TransferSourceChanged):
+        download(server, file_path)
+    assert not os.path.exists(f"{file_path}.segments.json")
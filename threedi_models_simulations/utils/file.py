@@ -1,8 +1,22 @@
 import hashlib
+import json
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 from uuid import uuid4
 from zipfile import ZIP_DEFLATED, ZipFile
 
+from threedi_models_simulations.constants import (
+    ARCHIVES_CACHE_DIR,
+    ARCHIVES_CACHE_MAX_SIZE,
+    CHECKSUM_CACHE_PATH,
+    CHECKSUM_CHUNK_SIZE,
+    CHECKSUM_MAX_WORKERS,
+    DOWNLOAD_MANIFEST_FILENAME,
+)
+
 
 def is_writable(working_dir: str) -> bool:
     """Try to write and remove an empty text file into given location."""
@@ -28,21 +42,164 @@ def unzip_archive(zip_filepath, location=None):
         return content_list
 
 
-def zip_into_archive(file_path, compression=ZIP_DEFLATED):
+def zip_into_archive(file_path, compression=ZIP_DEFLATED, zip_filepath=None):
     """Zip file."""
     zip_filename = os.path.basename(file_path)
-    zip_filepath = file_path.rsplit(".", 1)[0] + ".zip"
+    if zip_filepath is None:
+        zip_filepath = file_path.rsplit(".", 1)[0] + ".zip"
     with ZipFile(zip_filepath, "w", compression=compression) as zf:
         zf.write(file_path, arcname=zip_filename)
     return zip_filepath
 
 
+_archives_lock = threading.Lock()
+
+
+def cached_archive(file_path: str) -> Tuple[str, str]:
+    """Return path and MD5 of the zipped file, reusing the archive while the file is unchanged.
+
+    Archive content depends only on the file content, name and modification time,
+    so it is byte-identical to the one created with 'zip_into_archive'.
+    """
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    signature = [stat.st_size, stat.st_mtime_ns]
+    archive_dir = cached_archive_dir(file_path)
+    zip_filename = os.path.basename(file_path).rsplit(".", 1)[0] + ".zip"
+    zip_filepath = os.path.join(archive_dir, zip_filename)
+    info_filepath = os.path.join(archive_dir, "archive.json")
+    with _archives_lock:
+        try:
+            with open(info_filepath, "r") as info_file:
+                info = json.load(info_file)
+            if info["signature"] == signature and os.path.isfile(zip_filepath):
+                return zip_filepath, info["md5"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        os.makedirs(archive_dir, exist_ok=True)
+        tmp_zip_filepath = f"{zip_filepath}.tmp"
+        zip_into_archive(file_path, zip_filepath=tmp_zip_filepath)
+        os.replace(tmp_zip_filepath, zip_filepath)
+        digest = file_md5(zip_filepath)
+        with open(info_filepath, "w") as info_file:
+            json.dump({"signature": signature, "md5": digest}, info_file)
+        prune_archives_cache(keep_dir=archive_dir)
+        return zip_filepath, digest
+
+
+def cached_archive_dir(file_path: str) -> str:
+    """Return cache directory of the file archive, there is a single archive per file path."""
+    path_key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(ARCHIVES_CACHE_DIR, path_key)
+
+
+def remove_cached_archive(file_path: str):
+    """Remove cached archive of the file, e.g. once it is uploaded and committed."""
+    with _archives_lock:
+        shutil.rmtree(cached_archive_dir(file_path), ignore_errors=True)
+
+
+def prune_archives_cache(keep_dir: str = None, max_size: int = ARCHIVES_CACHE_MAX_SIZE):
+    """Remove least recently created archives until the cache fits in max_size bytes.
+
+    The archive in keep_dir is never removed. Must be called with _archives_lock held.
+    """
+    entries = []
+    total_size = 0
+    try:
+        archive_dirs = [entry.path for entry in os.scandir(ARCHIVES_CACHE_DIR)]
+    except OSError:
+        return
+    for archive_dir in archive_dirs:
+        try:
+            files = [entry for entry in os.scandir(archive_dir) if entry.is_file()]
+            size = sum(entry.stat().st_size for entry in files)
+            created = max((entry.stat().st_mtime for entry in files), default=0.0)
+        except OSError:
+            continue
+        total_size += size
+        if archive_dir != keep_dir:
+            entries.append((created, size, archive_dir))
+    for _, size, archive_dir in sorted(entries):
+        if total_size <= max_size:
+            break
+        shutil.rmtree(archive_dir, ignore_errors=True)
+        total_size -= size
+
+
+def file_md5(file_path: str, chunk_size: int = CHECKSUM_CHUNK_SIZE) -> str:
+    """Calculate MD5 hex digest of the file, reading it in chunks."""
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as file_to_check:
+        for chunk in iter(lambda: file_to_check.read(chunk_size), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class ChecksumCache:
+    """Persistent cache of file MD5 digests keyed by path, size, modification time and inode."""
+
+    def __init__(self, cache_path: str = CHECKSUM_CACHE_PATH):
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.entries = None
+
+    @staticmethod
+    def file_signature(file_path: str) -> list:
+        stat = os.stat(file_path)
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    def load(self):
+        try:
+            with open(self.cache_path, "r") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            entries = {}
+        self.entries = entries if isinstance(entries, dict) else {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_cache_path = f"{self.cache_path}.{threading.get_ident()}.tmp"
+        with open(tmp_cache_path, "w") as cache_file:
+            json.dump(self.entries, cache_file)
+        os.replace(tmp_cache_path, self.cache_path)
+
+    def md5(self, file_path: str) -> str:
+        """Return MD5 of the file, calculating it only if the file changed since the last call."""
+        file_path = os.path.abspath(file_path)
+        signature = self.file_signature(file_path)
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            entry = self.entries.get(file_path)
+        if entry and entry.get("signature") == signature:
+            return entry["md5"]
+        digest = file_md5(file_path)
+        with self.lock:
+            self.entries[file_path] = {"signature": signature, "md5": digest}
+            try:
+                self.save()
+            except OSError:
+                pass
+        return digest
+
+
+CHECKSUM_CACHE = ChecksumCache()
+
+
+def calculate_checksums(
+    file_paths: List[str], max_workers: int = CHECKSUM_MAX_WORKERS
+) -> Dict[str, str]:
+    """Calculate (cached) MD5 digests of the files in parallel."""
+    unique_file_paths = list(dict.fromkeys(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(CHECKSUM_CACHE.md5, unique_file_paths)
+        return dict(zip(unique_file_paths, digests))
+
+
 def is_file_checksum_equal(file_path, etag):
     """Checking if etag (MD5 checksum) matches checksum calculated for a given file."""
-    with open(file_path, "rb") as file_to_check:
-        data = file_to_check.read()
-        md5_returned = hashlib.md5(data).hexdigest()
-        return etag == md5_returned
+    return etag == CHECKSUM_CACHE.md5(file_path)
 
 
 def translate_illegal_chars(
@@ -54,3 +211,47 @@ def translate_illegal_chars(
         for char in text
     )
     return sanitized_text
+
+
+def read_download_manifest(directory: str) -> dict:
+    """Read manifest of files downloaded into the directory (filename -> size and etag)."""
+    manifest_path = os.path.join(directory, DOWNLOAD_MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def write_download_manifest(directory: str, manifest: dict):
+    """Write manifest of files downloaded into the directory."""
+    manifest_path = os.path.join(directory, DOWNLOAD_MANIFEST_FILENAME)
+    tmp_manifest_path = f"{manifest_path}.tmp"
+    with open(tmp_manifest_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    os.replace(tmp_manifest_path, manifest_path)
+
+
+def download_manifest_entry(download) -> dict:
+    """Return manifest entry describing remote Download object."""
+    return {"size": download.size, "etag": download.etag}
+
+
+def is_download_up_to_date(
+    directory: str, filename: str, download, manifest: dict
+) -> bool:
+    """Check if the file was already downloaded and is unchanged on the remote side."""
+    if manifest.get(filename) != download_manifest_entry(download):
+        return False
+    file_path = os.path.join(directory, filename)
+    return os.path.isfile(file_path) and os.path.getsize(file_path) == download.size
+
+
+def format_file_size(size: int) -> str:
+    """Return human readable file size."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
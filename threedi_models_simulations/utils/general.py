@@ -5,7 +5,6 @@ import shutil
 import warnings
 from uuid import uuid4
 
-import requests
 from qgis.gui import QgsFileWidget, QgsProjectionSelectionWidget
 from qgis.PyQt.QtCore import QLocale, QSettings, Qt
 from qgis.PyQt.QtGui import QDoubleValidator, QIntValidator, QPen
@@ -25,7 +24,7 @@ from qgis.PyQt.QtWidgets import (
 )
 
 from threedi_models_simulations.communication import progress_bar_callback_factory
-from threedi_models_simulations.constants import DOWNLOAD_CHUNK_SIZE
+from threedi_models_simulations.utils.msgpack import dumpb
 
 
 def migrate_schematisation_schema(schematisation_filepath, progress_callback=None):
@@ -252,13 +251,6 @@ def scan_widgets_parameters(
     return parameters
 
 
-def upload_local_file(upload, filepath):
-    """Upload file."""
-    with open(filepath, "rb") as file:
-        response = requests.put(upload.put_url, data=file)
-        return response
-
-
 def read_json_data(json_filepath):
     """Parse and return data from JSON file."""
     with open(json_filepath, "r+") as json_file:
@@ -273,13 +265,10 @@ def write_json_data(values, json_file_template):
         json_file.write(jsonf)
 
 
-def get_download_file(download, file_path):
-    """Getting file from Download object and writing it under given path."""
-    r = requests.get(download.get_url, stream=True, timeout=15)
-    with open(file_path, "wb") as f:
-        for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-            if chunk:
-                f.write(chunk)
+def write_msgpack_data(values, msgpack_file_template):
+    """Writing data to the (lz4 compressed) msgpack file."""
+    with open(msgpack_file_template, "wb") as msgpack_file:
+        msgpack_file.write(dumpb(values))
 
 
 class SeparatorDelegate(QStyledItemDelegate):
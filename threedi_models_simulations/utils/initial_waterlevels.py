@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+from threedi_api_client.openapi import ApiException
+
+from threedi_models_simulations.constants import INITIAL_WATERLEVELS_REGISTRY_PATH
+from threedi_models_simulations.utils.threedi_api import (
+    ThreediFileState,
+    fetch_model_initial_waterlevel,
+)
+
+
+def water_levels_digest(node_ids: Iterable[int], values: Iterable[float]) -> str:
+    """Return content hash of the 1D water levels, independent of the nodes order."""
+    pairs = sorted(
+        (int(node_id), float(value)) for node_id, value in zip(node_ids, values)
+    )
+    return hashlib.sha1(json.dumps(pairs).encode()).hexdigest()
+
+
+class InitialWaterLevelsRegistry:
+    """Persistent index of uploaded 1D initial water levels keyed by model and content hash."""
+
+    def __init__(self, registry_path: str = INITIAL_WATERLEVELS_REGISTRY_PATH):
+        self.registry_path = registry_path
+        self.lock = threading.Lock()
+        self.entries = None
+
+    def load(self):
+        try:
+            with open(self.registry_path, "r") as registry_file:
+                entries = json.load(registry_file)
+        except (OSError, ValueError):
+            entries = {}
+        self.entries = entries if isinstance(entries, dict) else {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
+        tmp_registry_path = f"{self.registry_path}.{threading.get_ident()}.tmp"
+        with open(tmp_registry_path, "w") as registry_file:
+            json.dump(self.entries, registry_file)
+        os.replace(tmp_registry_path, self.registry_path)
+
+    def model_entries(self, threedimodel_id) -> Dict[str, int]:
+        """Return digest -> initial water level ID mapping of the model."""
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            return dict(self.entries.get(str(threedimodel_id), {}))
+
+    def get(self, threedimodel_id, digest: str) -> Optional[int]:
+        return self.model_entries(threedimodel_id).get(digest)
+
+    def update(self, threedimodel_id, entries: Dict[str, Optional[int]]):
+        """Register (or remove if ID is None) initial water levels of the model."""
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            model_entries = self.entries.setdefault(str(threedimodel_id), {})
+            for digest, initial_waterlevel_id in entries.items():
+                if initial_waterlevel_id is None:
+                    model_entries.pop(digest, None)
+                else:
+                    model_entries[digest] = initial_waterlevel_id
+            try:
+                self.save()
+            except OSError:
+                pass
+
+    def register(self, threedimodel_id, digest: str, initial_waterlevel_id: int):
+        self.update(threedimodel_id, {digest: initial_waterlevel_id})
+
+    def discard(self, threedimodel_id, digest: str):
+        self.update(threedimodel_id, {digest: None})
+
+    def find_valid(self, threedi_api, threedimodel_id, digest: str) -> Optional[int]:
+        """Return ID of the registered initial water level if it is still valid on the server."""
+        initial_waterlevel_id = self.get(threedimodel_id, digest)
+        if initial_waterlevel_id is None:
+            return None
+        try:
+            initial_waterlevel = fetch_model_initial_waterlevel(
+                threedi_api, threedimodel_id, initial_waterlevel_id
+            )
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            initial_waterlevel = None
+        if (
+            initial_waterlevel is None
+            or initial_waterlevel.state != ThreediFileState.VALID.value
+        ):
+            self.discard(threedimodel_id, digest)
+            return None
+        return initial_waterlevel_id
+
+
+INITIAL_WATERLEVELS_REGISTRY = InitialWaterLevelsRegistry()
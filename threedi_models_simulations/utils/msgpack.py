@@ -1,12 +1,17 @@
 # This file is copied from N&S' asyncio-rpc package to prevent superfluous dependencies such as redis.
 import dataclasses
+import zlib
 from abc import ABC, abstractmethod
-from datetime import datetime
+from ast import literal_eval
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from io import BytesIO
-from typing import Any
+from struct import Struct
+from typing import Any, Iterable
 
 import msgpack
 import numpy as np
+from lz4.frame import LZ4FrameDecompressor
 from lz4.frame import compress as lz4_compress
 from lz4.frame import decompress as lz4_decompress
 
@@ -37,7 +42,18 @@ MAX_EXT_LEN = 2147483647
 # Internal registry
 # TODO: figure out if it is ok to do
 # this on the module...
-REGISTRY = {"obj_types": {}, "ext_types": {}, "serializables": {}}
+REGISTRY = {
+    "obj_types": {},
+    "ext_types": {},
+    "serializables": {},
+    "variants": {},
+    "binary_types": {},
+    "schemas": {},
+    "schema_ids": {},
+}
+# Effective obj type -> handler lookup tables, without and with use_binary,
+# rebuilt from the registry on every register call
+LOOKUPS = ({}, {})
 
 
 def register(obj_def):
@@ -52,16 +68,86 @@ def register(obj_def):
         class_name = obj_def.__name__
         REGISTRY["serializables"][class_name] = obj_def
         REGISTRY["obj_types"][obj_def] = DataclassHandler
+        # Schema (id and init field names) used by dumpb/loadb(..., use_schemas=True)
+        field_names = tuple(
+            field.name for field in dataclasses.fields(obj_def) if field.init
+        )
+        schema_id = SchemaDataclassHandler.schema_id(class_name, field_names)
+        REGISTRY["schemas"][schema_id] = (obj_def, field_names)
+        REGISTRY["schema_ids"][obj_def] = schema_id
 
         # Register the DataclassHandler if not done already
         if DataclassHandler.ext_type not in REGISTRY["ext_types"]:
             REGISTRY["ext_types"][DataclassHandler.ext_type] = DataclassHandler
+    elif hasattr(obj_def, "accepts"):
+        # Handlers with accepts classmethod are variants, used instead
+        # of the default handler of the obj_type for accepted instances,
+        # see GeometryArrayHandler below. Binary variants are only used
+        # with dumpb(..., use_binary=True).
+        assert hasattr(obj_def, "obj_type") and hasattr(obj_def, "ext_type")
+        REGISTRY["variants"].setdefault(obj_def.obj_type, []).append(obj_def)
+        REGISTRY["ext_types"][obj_def.ext_type] = obj_def
     else:
         # Assume the obj_def has obj_type and ext_type, as can be
-        # seen below.
+        # seen below. obj_type can be a tuple of types.
         assert hasattr(obj_def, "obj_type") and hasattr(obj_def, "ext_type")
-        REGISTRY["obj_types"][obj_def.obj_type] = obj_def
+        obj_types = obj_def.obj_type
+        if not isinstance(obj_types, tuple):
+            obj_types = (obj_types,)
+        # Binary handlers are only used with dumpb(..., use_binary=True),
+        # their ext_types are always unpacked.
+        registry = "binary_types" if getattr(obj_def, "binary", False) else "obj_types"
+        for obj_type in obj_types:
+            REGISTRY[registry][obj_type] = obj_def
         REGISTRY["ext_types"][obj_def.ext_type] = obj_def
+    update_lookups()
+
+
+class Variants:
+    """
+    Lookup table entry of an obj type with variants, selecting the
+    first variant accepting the instance or else the default handler.
+    """
+
+    def __init__(self, variants: tuple, default_handler):
+        self.variants = variants
+        self.default_handler = default_handler
+
+    def select(self, obj: Any):
+        for variant in self.variants:
+            if variant.accepts(obj):
+                return variant
+        return self.default_handler
+
+
+def update_lookups():
+    """
+    Rebuild LOOKUPS from the registry. With use_binary, binary handlers
+    (and variants) take precedence over the default handler of the obj type.
+    """
+    for use_binary, lookup in enumerate(LOOKUPS):
+        lookup.clear()
+        lookup.update(REGISTRY["obj_types"])
+        if use_binary:
+            lookup.update(REGISTRY["binary_types"])
+        for obj_type, variants in REGISTRY["variants"].items():
+            variants = tuple(
+                variant
+                for variant in variants
+                if use_binary or not getattr(variant, "binary", False)
+            )
+            if variants:
+                lookup[obj_type] = Variants(variants, lookup.get(obj_type))
+
+
+def handler_for(obj: Any, use_binary=False):
+    """
+    Return handler for the obj, None if its type is not registered.
+    """
+    handler = LOOKUPS[use_binary].get(type(obj))
+    if type(handler) is Variants:
+        return handler.select(obj)
+    return handler
 
 
 class NumpyArrayHandler(AbstractHandler):
@@ -95,6 +181,65 @@ class NumpyStructuredArrayHandler(NumpyArrayHandler):
     obj_type = np.void  # = the type of structured array's...
 
 
+class NumpyRawArrayHandler(AbstractHandler):
+    """
+    Serialize numpy array's as (dtype, shape, order) header
+    followed by the raw data buffer.
+
+    Unpacked array's are read-only views on the received bytes
+    (np.frombuffer), use .copy() when they need to be modified.
+
+    Binary handler, only used with dumpb(..., use_binary=True), peers
+    knowing only ext_type 1 and 2 can't unpack it.
+    """
+
+    ext_type = 8
+    obj_type = np.ndarray
+    binary = True
+
+    # Data buffer starts at an aligned offset, so the unpacked
+    # array is aligned as well
+    alignment = 16
+    header_length_dtype = np.dtype("<u4")
+
+    @classmethod
+    def packb(cls, array: np.ndarray) -> bytes:
+        if array.dtype.hasobject:
+            raise TypeError("Numpy array's with Python objects are not supported")
+        if array.flags.c_contiguous:
+            order, data = "C", array
+        elif array.flags.f_contiguous:
+            # Transposed Fortran ordered array is C contiguous, no copy needed
+            order, data = "F", array.T
+        else:
+            order, data = "C", np.ascontiguousarray(array)
+        descr = repr(np.lib.format.dtype_to_descr(array.dtype))
+        header = msgpack.packb((descr, array.shape, order), use_bin_type=True)
+        header_length = cls.header_length_dtype.itemsize + len(header)
+        padding = -header_length % cls.alignment
+        return b"".join(
+            (
+                np.array(len(header), dtype=cls.header_length_dtype).tobytes(),
+                header,
+                b"\0" * padding,
+                memoryview(data),
+            )
+        )
+
+    @classmethod
+    def unpackb(cls, data: bytes) -> np.ndarray:
+        header_start = cls.header_length_dtype.itemsize
+        header_end = header_start + int(
+            np.frombuffer(data, dtype=cls.header_length_dtype, count=1)[0]
+        )
+        descr, shape, order = msgpack.unpackb(data[header_start:header_end], raw=False)
+        dtype = np.lib.format.descr_to_dtype(literal_eval(descr))
+        offset = header_end + (-header_end % cls.alignment)
+        count = int(np.prod(shape, dtype=np.int64))
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        return array.reshape(shape, order=order)
+
+
 class NumpyInt32Handler(AbstractHandler):
     """
     Serialize np.int32
@@ -131,6 +276,76 @@ class NumpyInt64Handler(AbstractHandler):
 
 register(NumpyArrayHandler)
 register(NumpyStructuredArrayHandler)
+register(NumpyRawArrayHandler)
+
+
+class NumpyScalarHandler(AbstractHandler):
+    """
+    Serialize numpy scalars of all numeric dtypes (including bool,
+    datetime64 and timedelta64) as dtype code followed by the raw bytes.
+
+    np.int32 and np.int64 keep their own ext_types (6 and 7). Note that
+    np.float64 is a float subclass and is packed by msgpack itself, so
+    it is unpacked as a plain float.
+    """
+
+    ext_type = 12
+    obj_type = tuple(
+        {
+            np.bool_,
+            np.int8,
+            np.int16,
+            np.int32,
+            np.int64,
+            np.intc,
+            np.int_,
+            np.longlong,
+            np.uint8,
+            np.uint16,
+            np.uint32,
+            np.uint64,
+            np.uintc,
+            np.uint,
+            np.ulonglong,
+            np.float16,
+            np.float32,
+            np.float64,
+            np.longdouble,
+            np.complex64,
+            np.complex128,
+            np.clongdouble,
+            np.datetime64,
+            np.timedelta64,
+        }
+    )
+
+    # Caches of dtype -> length prefixed dtype code and back
+    dtype_codes = {}
+    code_dtypes = {}
+
+    @classmethod
+    def packb(cls, scalar) -> bytes:
+        dtype = scalar.dtype
+        try:
+            code = cls.dtype_codes[dtype]
+        except KeyError:
+            dtype_str = dtype.str.encode()
+            code = cls.dtype_codes[dtype] = bytes((len(dtype_str),)) + dtype_str
+        return code + scalar.tobytes()
+
+    @classmethod
+    def unpackb(cls, data: bytes):
+        offset = data[0] + 1
+        code = data[:offset]
+        try:
+            dtype = cls.code_dtypes[code]
+        except KeyError:
+            dtype = cls.code_dtypes[code] = np.dtype(code[1:].decode())
+        return np.frombuffer(data, dtype=dtype, count=1, offset=offset)[0]
+
+
+# Registered first, so the int32/int64 handlers take precedence
+register(NumpyScalarHandler)
 register(NumpyInt32Handler)
 register(NumpyInt64Handler)
 
@@ -152,6 +367,56 @@ class DatetimeHandler:
         return datetime.fromtimestamp(float(data))
 
 
+class BinaryDatetimeHandler:
+    """
+    Serialize datetime instances as int64 seconds and uint32 microseconds
+    of the wall time since epoch, a timezone flag and the UTC offset in
+    seconds, which covers datetime.min up to datetime.max. Aware datetimes
+    are unpacked with a fixed offset timezone.
+
+    Binary handler, only used with dumpb(..., use_binary=True).
+    """
+
+    ext_type = 11
+    obj_type = datetime
+    binary = True
+
+    layout = Struct("<qIBi")
+    epoch = datetime(1970, 1, 1)
+    timezones = {}
+
+    @classmethod
+    def packb(cls, dt: datetime) -> bytes:
+        utc_offset = dt.utcoffset()
+        if utc_offset is None:
+            aware, offset_seconds = 0, 0
+        else:
+            aware = 1
+            offset_seconds = utc_offset.days * 86400 + utc_offset.seconds
+            dt = dt.replace(tzinfo=None)
+        delta = dt - cls.epoch
+        return cls.layout.pack(
+            delta.days * 86400 + delta.seconds,
+            delta.microseconds,
+            aware,
+            offset_seconds,
+        )
+
+    @classmethod
+    def unpackb(cls, data: bytes) -> datetime:
+        seconds, microseconds, aware, offset_seconds = cls.layout.unpack(data)
+        dt = cls.epoch + timedelta(seconds=seconds, microseconds=microseconds)
+        if not aware:
+            return dt
+        try:
+            tz = cls.timezones[offset_seconds]
+        except KeyError:
+            tz = cls.timezones[offset_seconds] = timezone(
+                timedelta(seconds=offset_seconds)
+            )
+        return dt.replace(tzinfo=tz)
+
+
 class DataclassHandler:
     """
     Serialize dataclasses by serializing the .__dict__
@@ -183,6 +448,57 @@ class DataclassHandler:
         return klass(**data)
 
 
+class SchemaDataclassHandler:
+    """
+    Serialize dataclasses as a list of field values against the
+    schema of the registered dataclass:
+
+        [ExtType(10, schema_id), value_1, value_2, ...]
+
+    The (nested) field values are packed in the same packer pass and
+    field names are not repeated. The schema id is derived from the
+    class name and its field names, so both sides need to register
+    the same dataclass definitions. Payloads are unpacked with
+    loadb(..., use_schemas=True).
+    """
+
+    ext_type = 10
+
+    @classmethod
+    def schema_id(cls, class_name: str, field_names) -> bytes:
+        schema = f"{class_name}:{','.join(field_names)}".encode()
+        return zlib.crc32(schema).to_bytes(4, "little")
+
+    @classmethod
+    def pack(cls, obj) -> list:
+        schema_id = REGISTRY["schema_ids"][type(obj)]
+        _, field_names = REGISTRY["schemas"][schema_id]
+        return [msgpack.ExtType(cls.ext_type, schema_id)] + [
+            getattr(obj, field_name) for field_name in field_names
+        ]
+
+    @classmethod
+    def unpackb(cls, data: bytes):
+        # Placeholder replaced by the dataclass instance in list_hook
+        assert data in REGISTRY["schemas"], "dataclass schema not registered"
+        return SchemaReference(data)
+
+
+class SchemaReference(bytes):
+    """Schema id of the dataclass packed as a list of field values."""
+
+
+def list_hook(values: list):
+    """
+    Deserialize (loadb) hook for lists, turns lists packed by
+    SchemaDataclassHandler back into dataclasses.
+    """
+    if values and type(values[0]) is SchemaReference:
+        klass, _ = REGISTRY["schemas"][values[0]]
+        return klass(*values[1:])
+    return values
+
+
 class SliceHandler:
     """
     Serialize slices
@@ -200,20 +516,30 @@ class SliceHandler:
         return slice(*loadb(data))
 
 
-def default(obj: Any):
+def default(obj: Any, use_binary=False):
     """
     Serialize (dumpb) hook for obj types that msgpack does not
     process out of the box.
     """
-    if type(obj) in REGISTRY["obj_types"]:
+    handler = handler_for(obj, use_binary)
+    if handler is not None:
         # If the type is in the registry, use the
         # handler to serialize the obj
-        handler = REGISTRY["obj_types"][type(obj)]
         return msgpack.ExtType(handler.ext_type, handler.packb(obj))
 
     raise TypeError("Unknown type: %r" % (obj,))
 
 
+def schema_default(obj: Any, use_binary=False):
+    """
+    Serialize (dumpb) hook packing registered dataclasses with
+    SchemaDataclassHandler, other obj types are passed to default.
+    """
+    if type(obj) in REGISTRY["schema_ids"]:
+        return SchemaDataclassHandler.pack(obj)
+    return default(obj, use_binary)
+
+
 def ext_hook(ext_type: int, bytes_data: bytes):
     """
     Deserialize (loadb) hook for ext_types that are
@@ -231,21 +557,171 @@ def ext_hook(ext_type: int, bytes_data: bytes):
     raise TypeError("Unknown ext_type: %r" % (ext_type,))  # pragma: no cover
 
 
+def schema_ext_hook(ext_type: int, bytes_data: bytes):
+    """
+    Deserialize (loadb) hook unpacking the schema id of dataclasses
+    packed by SchemaDataclassHandler, other ext_types are passed
+    to ext_hook.
+    """
+    if ext_type == SchemaDataclassHandler.ext_type:
+        return SchemaDataclassHandler.unpackb(bytes_data)
+    return ext_hook(ext_type, bytes_data)
+
+
 def do_nothing(x):
     return x
 
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Codec:
+    """
+    Compression codec, codecs sharing the codec_id (e.g. lz4 with
+    different levels) are decompressed the same way.
+    """
+
+    def __init__(self, codec_id: int, compress_func, decompress_func):
+        self.codec_id = codec_id
+        self.compress = compress_func
+        self.decompress = decompress_func
+
+
+# Header of payloads dumped with a codec: 0xc1 (never used in msgpack,
+# and not the start of a lz4 frame) followed by the codec_id byte.
+CODEC_HEADER_MAGIC = b"\xc1"
+CODEC_HEADER_SIZE = 2
+# Payloads smaller than this are not worth compressing and stored raw
+MIN_COMPRESS_SIZE = 256
+
+NO_COMPRESSION_ID = 0
+LZ4_ID = 1
+ZSTD_ID = 2
+
+CODECS = {
+    "none": Codec(NO_COMPRESSION_ID, do_nothing, do_nothing),
+    "lz4": Codec(
+        LZ4_ID,
+        partial(lz4_compress, content_checksum=True),
+        lz4_decompress,
+    ),
+    "lz4-nochecksum": Codec(
+        LZ4_ID,
+        partial(lz4_compress, content_checksum=False),
+        lz4_decompress,
+    ),
+    "lz4-hc": Codec(
+        LZ4_ID,
+        partial(lz4_compress, compression_level=9, content_checksum=True),
+        lz4_decompress,
+    ),
+    "lz4-max": Codec(
+        LZ4_ID,
+        partial(lz4_compress, compression_level=16, content_checksum=True),
+        lz4_decompress,
+    ),
+}
+if zstandard is not None:
+    CODECS["zstd"] = Codec(
+        ZSTD_ID,
+        zstandard.ZstdCompressor(level=3).compress,
+        zstandard.ZstdDecompressor().decompress,
+    )
+    CODECS["zstd-max"] = Codec(
+        ZSTD_ID,
+        zstandard.ZstdCompressor(level=19).compress,
+        zstandard.ZstdDecompressor().decompress,
+    )
+DECOMPRESSORS = {codec.codec_id: codec.decompress for codec in CODECS.values()}
+
+
+def register_codec(name: str, codec: Codec):
+    """
+    Register compression codec, it can be used with dumpb(..., codec=name)
+    """
+    CODECS[name] = codec
+    DECOMPRESSORS.setdefault(codec.codec_id, codec.decompress)
+
+
+def compress(packed: bytes, codec: str, min_size: int = MIN_COMPRESS_SIZE) -> bytes:
+    """
+    Compress bytes with the codec, prefixed with the codec header.
+    """
+    if len(packed) < min_size:
+        codec = "none"
+    selected_codec = CODECS[codec]
+    header = CODEC_HEADER_MAGIC + bytes((selected_codec.codec_id,))
+    return header + selected_codec.compress(packed)
+
+
+def decompress(packed: bytes, decompress_func=lz4_decompress) -> bytes:
+    """
+    Decompress bytes, with the codec from the header if present.
+    Payloads without the header are decompressed with decompress_func.
+    """
+    if packed[:1] != CODEC_HEADER_MAGIC:
+        return decompress_func(packed)
+    codec_id = packed[1]
+    if codec_id not in DECOMPRESSORS:
+        raise ValueError(f"Unknown compression codec: {codec_id}")
+    return DECOMPRESSORS[codec_id](packed[CODEC_HEADER_SIZE:])
+
+
+def stream_decompressor(codec_id: int):
+    """
+    Return incremental decompressor for the codec_id, None if data
+    is not compressed.
+    """
+    if codec_id == NO_COMPRESSION_ID:
+        return None
+    if codec_id == LZ4_ID:
+        return LZ4FrameDecompressor()
+    if codec_id == ZSTD_ID and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f"Unknown compression codec: {codec_id}")
+
+
 def dumpb(
-    instance: Any, do_compress=True, compress_func=lz4_compress, use_bin_type=True
+    instance: Any,
+    do_compress=True,
+    compress_func=lz4_compress,
+    use_bin_type=True,
+    use_schemas=False,
+    codec=None,
+    min_size=MIN_COMPRESS_SIZE,
+    use_binary=False,
 ):
     """
     Dump/pack instance with msgpack to bytes
+
+    With use_schemas, dataclasses are packed compactly against
+    their registered schema (see SchemaDataclassHandler).
+
+    With use_binary, the binary handlers (NumpyRawArrayHandler,
+    BinaryDatetimeHandler and GeometryArrayHandler) are used instead
+    of the default ones. Only use it when the receiving
+    side knows their ext_types.
+
+    With codec (name from CODECS), the payload is compressed with it
+    and prefixed with the codec header, payloads smaller than min_size
+    are stored raw. Without codec compress_func is used, without header.
     """
-    if not do_compress:
-        compress_func = do_nothing
-    return compress_func(
-        msgpack.packb(instance, default=default, use_bin_type=use_bin_type)
+    default_func = schema_default if use_schemas else default
+    if use_binary:
+        default_func = partial(default_func, use_binary=True)
+    packed = msgpack.packb(
+        instance,
+        default=default_func,
+        use_bin_type=use_bin_type,
     )
+    if not do_compress:
+        return packed
+    if codec is not None:
+        return compress(packed, codec, min_size)
+    return compress_func(packed)
 
 
 def loadb(
@@ -254,28 +730,107 @@ def loadb(
     decompress_func=lz4_decompress,
     raw=False,
     strict_map_key=True,
+    use_schemas=False,
 ):
     """
     Load/unpack bytes back to instance
+
+    The codec is detected from the header, payloads without
+    header are decompressed with decompress_func.
+
+    Payloads dumped with use_schemas need use_schemas as well, the
+    list_hook resolving the dataclasses is only installed then.
     """
     if packed is None:
         return None
-    if not do_decompress:
-        decompress_func = do_nothing
+    if do_decompress:
+        packed = decompress(packed, decompress_func)
+    schema_kwargs = (
+        {"ext_hook": schema_ext_hook, "list_hook": list_hook}
+        if use_schemas
+        else {"ext_hook": ext_hook}
+    )
     return msgpack.unpackb(
-        decompress_func(packed),
-        ext_hook=ext_hook,
+        packed,
+        **schema_kwargs,
+        max_ext_len=MAX_EXT_LEN,
+        max_str_len=MAX_STR_LEN,
+        raw=raw,
+        strict_map_key=strict_map_key,
+    )
+
+
+def stream_loadb(
+    chunks: Iterable[bytes],
+    do_decompress=True,
+    raw=False,
+    strict_map_key=True,
+    use_schemas=False,
+):
+    """
+    Load/unpack instance from a stream of (compressed) byte chunks,
+    e.g. straight from a HTTP response.
+
+    Every chunk is decompressed and fed to the unpacker as soon as it
+    arrives, so the compressed data is never kept in memory as a whole.
+    The unpacker does buffer the decompressed data until the instance is
+    complete, and ext payloads are copied out of that buffer before they
+    are unpacked (numpy array's are not decoded into preallocated
+    buffers). See loadb for use_schemas.
+    """
+    schema_kwargs = (
+        {"ext_hook": schema_ext_hook, "list_hook": list_hook}
+        if use_schemas
+        else {"ext_hook": ext_hook}
+    )
+    unpacker = msgpack.Unpacker(
+        **schema_kwargs,
+        max_buffer_size=0,
         max_ext_len=MAX_EXT_LEN,
         max_str_len=MAX_STR_LEN,
+        max_bin_len=MAX_EXT_LEN,
+        max_array_len=MAX_EXT_LEN,
+        max_map_len=MAX_EXT_LEN,
         raw=raw,
         strict_map_key=strict_map_key,
     )
+    instances = []
+    decompressor = None
+    # Codec is detected once the header (or the start of a lz4 frame) arrives
+    head = b"" if do_decompress else None
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if head is not None:
+            head += chunk
+            if len(head) < CODEC_HEADER_SIZE:
+                continue
+            if head[:1] == CODEC_HEADER_MAGIC:
+                decompressor = stream_decompressor(head[1])
+                chunk = head[CODEC_HEADER_SIZE:]
+            else:
+                decompressor = LZ4FrameDecompressor()
+                chunk = head
+            head = None
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        unpacker.feed(chunk)
+        instances.extend(unpacker)
+    if head:
+        raise ValueError("Incomplete compressed data stream")
+    if decompressor is not None and not getattr(decompressor, "eof", True):
+        raise ValueError("Incomplete compressed data stream")
+    if len(instances) != 1:
+        raise ValueError(f"Expected one packed instance, got {len(instances)}")
+    return instances[0]
 
 
 # Register custom handlers
 register(DatetimeHandler)
+register(BinaryDatetimeHandler)
 register(SliceHandler)
 
+from shapely import from_wkb, is_geometry, is_missing, to_wkb
 from shapely.geometry import (
     GeometryCollection,
     LinearRing,
@@ -373,3 +928,67 @@ register(MultiPointHandler)
 register(MultiLineStringHandler)
 register(MultiPolygonHandler)
 register(GeometryCollectionHandler)
+
+
+class GeometryArrayHandler(AbstractHandler):
+    """
+    Handler for numpy object array's of Shapely geometries (or None).
+    Geometries are converted to WKB at once with the vectorized
+    Shapely functions and packed as (shape, lengths, blob).
+
+    The WKB's in the blob are ordered by length, so all WKB's of the
+    same length are unpacked in one call as a fixed width (void) array.
+
+    Binary handler, only used with dumpb(..., use_binary=True), peers
+    knowing only the single geometry ext_types (101-108) can't unpack it.
+    """
+
+    ext_type = 109
+    obj_type = np.ndarray
+    binary = True
+
+    # Vectorized len() of the WKB's
+    wkb_length = np.frompyfunc(len, 1, 1)
+
+    @classmethod
+    def accepts(cls, array: np.ndarray) -> bool:
+        return (
+            array.dtype == object
+            and array.size > 0
+            and bool(np.all(is_geometry(array) | is_missing(array)))
+        )
+
+    @classmethod
+    def blob_order(cls, lengths: np.ndarray) -> np.ndarray:
+        """Return indices of the present geometries, in blob order."""
+        present = np.flatnonzero(lengths >= 0)
+        return present[np.argsort(lengths[present], kind="stable")]
+
+    @classmethod
+    def packb(cls, array: np.ndarray) -> bytes:
+        flat = array.ravel()
+        wkbs = to_wkb(flat)
+        # Missing geometries are marked with length -1
+        lengths = np.full(len(wkbs), -1, dtype=np.int64)
+        present = ~is_missing(flat)
+        lengths[present] = cls.wkb_length(wkbs[present])
+        blob = b"".join(wkbs[cls.blob_order(lengths)])
+        return dumpb((array.shape, lengths, blob), do_compress=False)
+
+    @classmethod
+    def unpackb(cls, data: bytes) -> np.ndarray:
+        shape, lengths, blob = loadb(data, do_decompress=False)
+        order = cls.blob_order(lengths)
+        group_lengths, group_counts = np.unique(lengths[order], return_counts=True)
+        wkbs = np.empty(len(lengths), dtype=object)
+        offset, start = 0, 0
+        for length, count in zip(group_lengths.tolist(), group_counts.tolist()):
+            wkbs[order[start : start + count]] = np.frombuffer(
+                blob, dtype=f"V{length}", count=count, offset=offset
+            ).astype(object)
+            offset += length * count
+            start += count
+        return from_wkb(wkbs).reshape(shape)
+
+
+register(GeometryArrayHandler)
@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+from threedi_models_simulations.constants import (
+    POLL_BACKOFF_FACTOR,
+    POLL_INITIAL_INTERVAL,
+    POLL_JITTER,
+    POLL_MAX_INTERVAL,
+)
+
+
+class PollTimeoutError(Exception):
+    """Exception raised when the awaited state wasn't reached before the deadline."""
+
+
+class PollingStats:
+    """Thread-safe poll counts and wait times per resource, e.g. 'revision:123'."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = defaultdict(
+            lambda: {
+                "waits": 0,
+                "polls": 0,
+                "wakeups": 0,
+                "timeouts": 0,
+                "total_wait_time": 0.0,
+                "max_wait_time": 0.0,
+            }
+        )
+
+    def record(self, resource, polls, wakeups, wait_time, timed_out):
+        with self.lock:
+            entry = self.entries[resource]
+            entry["waits"] += 1
+            entry["polls"] += polls
+            entry["wakeups"] += wakeups
+            entry["timeouts"] += int(timed_out)
+            entry["total_wait_time"] += wait_time
+            entry["max_wait_time"] = max(entry["max_wait_time"], wait_time)
+
+    def as_dict(self) -> dict:
+        with self.lock:
+            return {key: dict(value) for key, value in self.entries.items()}
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+STATS = PollingStats()
+_waiters_lock = threading.Lock()
+_waiters = defaultdict(set)
+
+
+def notify(resource: str):
+    """Wake up all waits on the resource, so they check its state right away.
+
+    Called for simulation resources by the simulations websocket worker, other
+    resources have no push events and are only polled.
+    """
+    with _waiters_lock:
+        events = list(_waiters.get(resource, ()))
+    for event in events:
+        event.set()
+
+
+def wait_for(
+    check: Callable[[], Any],
+    resource: str,
+    timeout: Optional[float] = None,
+    initial_interval: float = POLL_INITIAL_INTERVAL,
+    max_interval: float = POLL_MAX_INTERVAL,
+    backoff_factor: float = POLL_BACKOFF_FACTOR,
+    jitter: float = POLL_JITTER,
+):
+    """Call `check` until it returns a value other than None and return that value.
+
+    Intervals between calls grow exponentially with random jitter. Waiting is cut short
+    when `notify` is called for the resource (only done for simulations, see `notify`).
+    Exceptions raised by `check` are propagated.
+    Raises PollTimeoutError if `timeout` seconds pass without reaching the awaited state.
+    """
+    started = time.monotonic()
+    deadline = started + timeout if timeout is not None else None
+    interval = initial_interval
+    polls, wakeups, timed_out = 0, 0, False
+    event = threading.Event()
+    with _waiters_lock:
+        _waiters[resource].add(event)
+    try:
+        while True:
+            event.clear()
+            polls += 1
+            result = check()
+            if result is not None:
+                return result
+            sleep_time = interval * random.uniform(1 - jitter, 1 + jitter)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    raise PollTimeoutError(
+                        f"Timed out after {timeout:g}s waiting for {resource}."
+                    )
+                sleep_time = min(sleep_time, remaining)
+            if event.wait(sleep_time):
+                wakeups += 1
+            interval = min(interval * backoff_factor, max_interval)
+    finally:
+        with _waiters_lock:
+            _waiters[resource].discard(event)
+            if not _waiters[resource]:
+                del _waiters[resource]
+        STATS.record(resource, polls, wakeups, time.monotonic() - started, timed_out)
+
+
+def polling_stats() -> dict:
+    """Return poll counts and wait times per resource."""
+    return STATS.as_dict()
+
+
+def clear_polling_stats():
+    """Reset polling statistics."""
+    STATS.clear()
@@ -1,10 +1,18 @@
+import fnmatch
+import hashlib
 import json
-from collections import OrderedDict
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, List, Tuple
+from functools import wraps
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Tuple
 
-import requests
 from qgis.core import Qgis, QgsMessageLog
 from threedi_api_client import ThreediApi
 from threedi_api_client.openapi import (
@@ -89,8 +97,6 @@ from threedi_api_client.openapi import (
     WindDragCoefficient,
 )
 
-from threedi_models_simulations.constants import DOWNLOAD_CHUNK_SIZE
-
 
 class SimulationStatusName(Enum):
     CRASHED = "crashed"
@@ -177,6 +183,10 @@ class ThreediModelTaskStatus(Enum):
 
 
 FETCH_LIMIT = 250
+FETCH_MAX_WORKERS = 4
+
+# Stable identity (host, version and token hash) of the API clients, used as API cache key
+API_IDENTITIES = weakref.WeakKeyDictionary()
 
 
 def get_api_client_with_personal_api_token(
@@ -188,22 +198,193 @@ def get_api_client_with_personal_api_token(
         "THREEDI_API_USERNAME": "__key__",
         "THREEDI_API_PERSONAL_API_TOKEN": personal_api_token,
     }
-    return ThreediApi(config=config, version=version)
+    threedi_api = ThreediApi(config=config, version=version)
+    token_hash = hashlib.sha256(personal_api_token.encode()).hexdigest()
+    API_IDENTITIES[threedi_api] = (api_host, version, token_hash)
+    return threedi_api
 
 
-def paginated_fetch(api_method: Callable, *args, **kwargs) -> List[Any]:
-    """Method for iterative fetching of the data via given API endpoint."""
+def paginated_pages(
+    api_method: Callable, *args, max_workers: int = FETCH_MAX_WORKERS, **kwargs
+) -> Iterator[List[Any]]:
+    """Generator yielding consecutive result pages of the given API endpoint.
+
+    Once the first page reveals the total count, the next pages are prefetched
+    by (at most) `max_workers` threads, but are still yielded in the API ordering.
+    Closing the generator early cancels fetching of the remaining pages.
+    """
     limit = FETCH_LIMIT
     response = api_method(*args, limit=limit, **kwargs)
-    response_count = response.count
-    results_list = response.results
-    if response_count > limit:
-        for offset in range(limit, response_count, limit):
-            response = api_method(*args, offset=offset, limit=limit, **kwargs)
-            results_list += response.results
+    yield response.results
+    offsets = iter(range(limit, response.count, limit))
+
+    def fetch_page(offset):
+        page = api_method(*args, offset=offset, limit=limit, **kwargs)
+        return page.results
+
+    if max_workers <= 1:
+        for offset in offsets:
+            yield fetch_page(offset)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = deque(
+            executor.submit(fetch_page, offset)
+            for offset in islice(offsets, max_workers)
+        )
+        while pending:
+            page_results = pending.popleft().result()
+            for offset in islice(offsets, 1):
+                pending.append(executor.submit(fetch_page, offset))
+            yield page_results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def paginated_iter(api_method: Callable, *args, **kwargs) -> Iterator[Any]:
+    """Generator yielding results of the given API endpoint one by one."""
+    for page_results in paginated_pages(api_method, *args, **kwargs):
+        yield from page_results
+
+
+def paginated_fetch(api_method: Callable, *args, **kwargs) -> List[Any]:
+    """Method for iterative fetching of the data via given API endpoint."""
+    results_list = []
+    for page_results in paginated_pages(api_method, *args, **kwargs):
+        results_list += page_results
     return results_list
 
 
+class ApiResponseCache:
+    """Thread-safe in-process cache for the read-only API calls.
+
+    Every endpoint keeps its own LRU ordered entries with a time to live and
+    a maximum size. Hits and misses are counted per endpoint.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.entries = defaultdict(OrderedDict)
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+    def get(self, endpoint: str, key: Tuple) -> Tuple[bool, Any]:
+        """Return (found, value) pair for the given endpoint and key."""
+        with self.lock:
+            endpoint_entries = self.entries[endpoint]
+            try:
+                expires_at, value = endpoint_entries[key]
+            except KeyError:
+                self.misses[endpoint] += 1
+                return False, None
+            if expires_at < time.monotonic():
+                del endpoint_entries[key]
+                self.misses[endpoint] += 1
+                return False, None
+            endpoint_entries.move_to_end(key)
+            self.hits[endpoint] += 1
+            return True, value
+
+    def put(self, endpoint: str, key: Tuple, value: Any, ttl: float, maxsize: int):
+        """Store value and evict the least recently used entries above maxsize."""
+        with self.lock:
+            endpoint_entries = self.entries[endpoint]
+            endpoint_entries[key] = (time.monotonic() + ttl, value)
+            endpoint_entries.move_to_end(key)
+            while len(endpoint_entries) > maxsize:
+                endpoint_entries.popitem(last=False)
+
+    def invalidate(self, *endpoints: str):
+        """Drop all entries of the given endpoints."""
+        with self.lock:
+            for endpoint in endpoints:
+                self.entries.pop(endpoint, None)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self.lock:
+            self.entries.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> dict:
+        """Return hits, misses and current size per endpoint."""
+        with self.lock:
+            endpoints = set(self.hits) | set(self.misses)
+            return {
+                endpoint: {
+                    "hits": self.hits[endpoint],
+                    "misses": self.misses[endpoint],
+                    "size": len(self.entries.get(endpoint, ())),
+                }
+                for endpoint in sorted(endpoints)
+            }
+
+
+API_CACHE = ApiResponseCache()
+
+
+def cached_api_call(ttl: float, maxsize: int = 128):
+    """Decorator memoizing read-only API call results per API client identity and given arguments.
+
+    Callers get their own copy of the cached results. Calls with API clients without
+    identity (not created by get_api_client_with_personal_api_token) are not cached.
+    The original function stays available as the `uncached` attribute of the wrapper.
+    """
+
+    def decorator(func):
+        endpoint = func.__name__
+
+        @wraps(func)
+        def wrapper(threedi_api, *args, **kwargs):
+            try:
+                identity = API_IDENTITIES.get(threedi_api)
+            except TypeError:  # Not weak referenceable
+                identity = None
+            if identity is None:
+                return func(threedi_api, *args, **kwargs)
+            key = (identity, args, tuple(sorted(kwargs.items())))
+            try:
+                found, value = API_CACHE.get(endpoint, key)
+            except TypeError:  # Unhashable arguments
+                return func(threedi_api, *args, **kwargs)
+            if found:
+                return deepcopy(value)
+            value = func(threedi_api, *args, **kwargs)
+            API_CACHE.put(endpoint, key, deepcopy(value), ttl, maxsize)
+            return value
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
+
+
+def invalidates_api_cache(*endpoints: str):
+    """Decorator dropping cached results of the given endpoints after a successful write call."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            API_CACHE.invalidate(*endpoints)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def api_cache_stats() -> dict:
+    """Return API cache hit and miss counters per endpoint."""
+    return API_CACHE.stats()
+
+
+def clear_api_cache():
+    """Drop all cached API responses."""
+    API_CACHE.clear()
+
+
 def expiration_time():
     return datetime.now(timezone.utc) - timedelta(days=7)
 
@@ -265,6 +446,7 @@ def fetch_schematisations_with_count(
     return response.results, response.count
 
 
+@cached_api_call(ttl=300)
 def fetch_schematisation(threedi_api, schematisation_pk: int, **data) -> Schematisation:
     """Get schematisation with given id."""
     return threedi_api.schematisations_read(id=schematisation_pk, **data)
@@ -334,15 +516,6 @@ def extract_error_message(e):
     return f"Error: {error_details}"
 
 
-def get_download_file(download, file_path):
-    """Getting file from Download object and writing it under given path."""
-    r = requests.get(download.get_url, stream=True, timeout=15)
-    with open(file_path, "wb") as f:
-        for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-            if chunk:
-                f.write(chunk)
-
-
 def fetch_schematisation_revision_models(
     threedi_api, schematisation_pk: int, revision_pk: int
 ) -> List[ThreediModel]:
@@ -379,6 +552,7 @@ def fetch_model_gridadmin_download(
     return result_file, download
 
 
+@cached_api_call(ttl=60)
 def fetch_model_initial_waterlevels(
     threedi_api, threedimodel_id: str
 ) -> List[InitialWaterlevel]:
@@ -417,12 +591,14 @@ def create_simulation_initial_1d_water_level_file(
     )
 
 
+@invalidates_api_cache("fetch_model_initial_waterlevels")
 def create_initial_water_level(
     threedi_api, threedimodel_id: str, **data
 ) -> InitialWaterlevel:
     return threedi_api.threedimodels_initial_waterlevels_create(threedimodel_id, data)
 
 
+@invalidates_api_cache("fetch_model_initial_waterlevels")
 def upload_initial_water_level(
     threedi_api, threedimodel_id: str, water_level_id: int, **data
 ) -> Upload:
@@ -432,6 +608,15 @@ def upload_initial_water_level(
     )
 
 
+@invalidates_api_cache("fetch_model_initial_waterlevels")
+def delete_initial_water_level(
+    threedi_api, threedimodel_id: str, water_level_id: int
+) -> None:
+    threedi_api.threedimodels_initial_waterlevels_delete(
+        water_level_id, threedimodel_id
+    )
+
+
 def fetch_model_initial_waterlevels_download(threedi_api, id, threedimodel_id: str):
     return threedi_api.threedimodels_initial_waterlevels_download(id, threedimodel_id)
 
@@ -474,6 +659,7 @@ def fetch_model_geopackage_download(
     return result_file, download
 
 
+@invalidates_api_cache("fetch_schematisation")
 def create_schematisation_revision(
     threedi_api, schematisation_pk: int, empty: bool = False, **data
 ) -> SchematisationRevision:
@@ -492,6 +678,7 @@ def upload_schematisation_revision(
     )
 
 
+@invalidates_api_cache("fetch_schematisation")
 def create_schematisation(threedi_api, name: str, owner: str, **data) -> Schematisation:
     data.update({"name": name, "owner": owner})
     return threedi_api.schematisations_create(data)
@@ -575,6 +762,7 @@ def fetch_schematisation_revision_task(
     )
 
 
+@invalidates_api_cache("fetch_model", "fetch_contracts")
 def create_schematisation_revision_model(
     threedi_api,
     schematisation_pk: int,
@@ -591,6 +779,7 @@ def create_schematisation_revision_model(
     )
 
 
+@invalidates_api_cache("fetch_schematisation")
 def commit_schematisation_revision(
     threedi_api, schematisation_pk: int, revision_pk: int, **data
 ) -> Commit:
@@ -604,10 +793,12 @@ def fetch_model_tasks(threedi_api, threedimodel_id: str) -> List[ThreediModelTas
     return paginated_fetch(threedi_api.threedimodels_tasks_list, threedimodel_id)
 
 
+@cached_api_call(ttl=60)
 def fetch_model(threedi_api, threedimodel_id: int) -> ThreediModel:
     return threedi_api.threedimodels_read(threedimodel_id)
 
 
+@invalidates_api_cache("fetch_model", "fetch_contracts")
 def delete_model(threedi_api, threedimodel_id: int) -> None:
     """Delete 3Di model with a given id."""
     threedi_api.threedimodels_delete(threedimodel_id)
@@ -647,6 +838,7 @@ def fetch_models_with_count(
     return models_list, models_count
 
 
+@cached_api_call(ttl=300)
 def fetch_contracts(threedi_api, **data) -> List[Contract]:
     """Get valid 3Di contracts list."""
     return paginated_fetch(threedi_api.contracts_list, **data)
@@ -706,6 +898,21 @@ def fetch_simulation_downloads(
     return downloads
 
 
+def filter_simulation_downloads(
+    downloads: List[Tuple[ResultFile, Download]], patterns: List[str]
+) -> List[Tuple[ResultFile, Download]]:
+    """Filter simulation downloads by result file name glob patterns (case-insensitive)."""
+    patterns = [pattern.strip().lower() for pattern in patterns if pattern.strip()]
+    return [
+        (result_file, download)
+        for result_file, download in downloads
+        if any(
+            fnmatch.fnmatchcase(result_file.filename.lower(), pattern)
+            for pattern in patterns
+        )
+    ]
+
+
 def fetch_simulation_statuses(threedi_api, **params) -> List[SimulationStatus]:
     """Fetch simulations statuses."""
     params["created__date__gt"] = expiration_date()
@@ -713,6 +920,15 @@ def fetch_simulation_statuses(threedi_api, **params) -> List[SimulationStatus]:
     return statuses
 
 
+def fetch_simulation_statuses_pages(
+    threedi_api, **params
+) -> Iterator[List[SimulationStatus]]:
+    """Fetch simulations statuses page by page."""
+    params["created__date__gt"] = expiration_date()
+    return paginated_pages(threedi_api.statuses_list, **params)
+
+
+@cached_api_call(ttl=300)
 def fetch_simulation_settings_overview(
     threedi_api, simulation_pk: str
 ) -> SimulationSettingsOverview:
@@ -751,30 +967,35 @@ def fetch_simulation_templates_with_count(
     return simulation_templates_list, simulation_templates_count
 
 
+@invalidates_api_cache("fetch_simulation_settings_overview")
 def create_simulation_settings_physical(
     threedi_api, simulation_pk: int, **data
 ) -> PhysicalSettings:
     return threedi_api.simulations_settings_physical_create(str(simulation_pk), data)
 
 
+@invalidates_api_cache("fetch_simulation_settings_overview")
 def create_simulation_settings_numerical(
     threedi_api, simulation_pk: int, **data
 ) -> NumericalSettings:
     return threedi_api.simulations_settings_numerical_create(str(simulation_pk), data)
 
 
+@invalidates_api_cache("fetch_simulation_settings_overview")
 def create_simulation_settings_time_step(
     threedi_api, simulation_pk: int, **data
 ) -> TimeStepSettings:
     return threedi_api.simulations_settings_time_step_create(str(simulation_pk), data)
 
 
+@invalidates_api_cache("fetch_simulation_settings_overview")
 def create_simulation_settings_aggregation(
     threedi_api, simulation_pk: int, **data
 ) -> AggregationSettings:
     return threedi_api.simulations_settings_aggregation_create(str(simulation_pk), data)
 
 
+@invalidates_api_cache("fetch_simulation_settings_overview")
 def create_simulation_settings_water_quality(
     threedi_api, simulation_pk: int, **data
 ) -> WaterQualitySettings:
@@ -0,0 +1,519 @@
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from threedi_models_simulations.constants import (
+    DEFAULT_UPLOAD_TIMEOUT,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_SEGMENT_SIZE,
+    DOWNLOAD_SEGMENT_WORKERS,
+    MULTIPART_ETAG_PART_SIZES,
+    TRANSFER_BACKOFF_FACTOR,
+    TRANSFER_CONNECT_TIMEOUT,
+    TRANSFER_POOL_SIZE,
+    TRANSFER_READ_TIMEOUT,
+    TRANSFER_RETRIES,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_RETRIES,
+    UPLOAD_RETRY_BACKOFF,
+)
+from threedi_models_simulations.utils.file import file_md5
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class TransferCanceled(Exception):
+    """Exception raised when a file transfer is canceled by the progress callback."""
+
+
+class TransferVerificationError(Exception):
+    """Exception raised when downloaded file doesn't match the expected size or checksum."""
+
+
+class TransferSourceChanged(TransferVerificationError):
+    """Exception raised when the downloaded file changed on the server during the download."""
+
+
+class RangeNotSupported(Exception):
+    """Exception raised when the server ignores HTTP Range requests."""
+
+
+class TransferSettings:
+    """Connection pool, timeout and retry settings shared by all transfer sessions."""
+
+    def __init__(self):
+        self.pool_size = TRANSFER_POOL_SIZE
+        self.connect_timeout = TRANSFER_CONNECT_TIMEOUT
+        self.read_timeout = TRANSFER_READ_TIMEOUT
+        self.upload_read_timeout = DEFAULT_UPLOAD_TIMEOUT
+        self.retries = TRANSFER_RETRIES
+        self.backoff_factor = TRANSFER_BACKOFF_FACTOR
+        self.generation = 0
+
+
+SETTINGS = TransferSettings()
+_local = threading.local()
+
+
+def configure(
+    pool_size: Optional[int] = None,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    upload_read_timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+):
+    """Change transfer settings, sessions are rebuilt on their next use."""
+    if pool_size is not None:
+        SETTINGS.pool_size = pool_size
+    if connect_timeout is not None:
+        SETTINGS.connect_timeout = connect_timeout
+    if read_timeout is not None:
+        SETTINGS.read_timeout = read_timeout
+    if upload_read_timeout is not None:
+        SETTINGS.upload_read_timeout = upload_read_timeout
+    if retries is not None:
+        SETTINGS.retries = retries
+    if backoff_factor is not None:
+        SETTINGS.backoff_factor = backoff_factor
+    SETTINGS.generation += 1
+
+
+def _create_session() -> requests.Session:
+    """Create keep-alive session with pooled connections and retry policy."""
+    # Uploads (PUT) are not retried here, upload_file retries them itself
+    # restarting the file stream
+    retry = Retry(
+        total=SETTINGS.retries,
+        backoff_factor=SETTINGS.backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=SETTINGS.pool_size,
+        pool_maxsize=SETTINGS.pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the transfer session of the current thread."""
+    session = getattr(_local, "session", None)
+    if session is None or _local.generation != SETTINGS.generation:
+        if session is not None:
+            session.close()
+        session = _create_session()
+        _local.session = session
+        _local.generation = SETTINGS.generation
+    return session
+
+
+def close_session():
+    """Close the transfer session of the current thread."""
+    session = getattr(_local, "session", None)
+    if session is not None:
+        session.close()
+        _local.session = None
+
+
+class _UploadReader:
+    """Sized and seekable file wrapper reporting the upload progress."""
+
+    def __init__(self, fileobj, size: int, chunk_size: int, callback_func=None):
+        self.fileobj = fileobj
+        self.size = size
+        self.chunk_size = chunk_size
+        self.callback_func = callback_func
+        self.reported = 0
+
+    def __len__(self):
+        return self.size
+
+    def tell(self):
+        return self.fileobj.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        position = self.fileobj.seek(offset, whence)
+        self.reported = min(self.reported, position)
+        return position
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        if callable(self.callback_func):
+            position = self.fileobj.tell()
+            if position - self.reported >= self.chunk_size or position == self.size:
+                self.reported = position
+                self.callback_func(position, self.size)
+        return data
+
+
+def iter_download(
+    url: str,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    callback_func: Optional[ProgressCallback] = None,
+) -> Iterator[bytes]:
+    """Stream file from the url chunk by chunk, without storing it."""
+    session = get_session()
+    timeout = (SETTINGS.connect_timeout, SETTINGS.read_timeout)
+    downloaded_bytes = 0
+    with session.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        total_bytes = int(response.headers.get("Content-Length", 0))
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                downloaded_bytes += len(chunk)
+                if callable(callback_func):
+                    callback_func(downloaded_bytes, total_bytes)
+                yield chunk
+
+
+def download_file(
+    url: str,
+    file_path: str,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    callback_func: Optional[ProgressCallback] = None,
+) -> int:
+    """Stream file from the url into the given path, return number of downloaded bytes."""
+    downloaded_bytes = 0
+    with open(file_path, "wb") as f:
+        for chunk in iter_download(url, chunk_size, callback_func):
+            f.write(chunk)
+            downloaded_bytes += len(chunk)
+    return downloaded_bytes
+
+
+def upload_file(
+    url: str,
+    file_path: str,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    callback_func: Optional[ProgressCallback] = None,
+    retries: int = UPLOAD_RETRIES,
+    retry_backoff: float = UPLOAD_RETRY_BACKOFF,
+) -> requests.Response:
+    """Stream file under given path to the (presigned) url.
+
+    Presigned URLs accept the whole object only, so a failed upload is retried
+    from the start of the file with exponential backoff.
+    """
+    session = get_session()
+    timeout = (SETTINGS.connect_timeout, SETTINGS.upload_read_timeout)
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        raise IOError(f"The file '{file_path}' is empty.")
+    headers = {"Content-Length": str(file_size)}
+    for attempt in range(retries + 1):
+        try:
+            with open(file_path, "rb") as fileobj:
+                reader = _UploadReader(fileobj, file_size, chunk_size, callback_func)
+                response = session.put(
+                    url, data=reader, headers=headers, timeout=timeout
+                )
+            if response.status_code < 500:
+                response.raise_for_status()
+                return response
+            error = requests.HTTPError(
+                f"{response.status_code} Server Error for url: {response.url}",
+                response=response,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+        if attempt < retries:
+            retry_time = time.monotonic() + retry_backoff * 2**attempt
+            while time.monotonic() < retry_time:
+                # Report restart of the upload, it also allows the callback to cancel the waiting
+                if callable(callback_func):
+                    callback_func(0, file_size)
+                time.sleep(min(1.0, max(0.0, retry_time - time.monotonic())))
+    raise error
+
+
+def _normalize_etag(etag: Optional[str]) -> Optional[str]:
+    """Return ETag without quotes, None for missing and weak ETags."""
+    if not etag or etag.startswith("W/"):
+        return None
+    return etag.strip('"').lower()
+
+
+def _parse_etag(etag: Optional[str]) -> Optional[Tuple[str, int]]:
+    """Return (MD5 hex digest, number of parts) of the plain or multipart ETag.
+
+    The number of parts is 0 for plain ETags (MD5 of the whole file). None is
+    returned for ETags that don't contain a MD5 digest.
+    """
+    etag = _normalize_etag(etag)
+    match = re.fullmatch(r"([0-9a-f]{32})(?:-([1-9][0-9]*))?", etag or "")
+    if match is None:
+        return None
+    return match.group(1), int(match.group(2) or 0)
+
+
+def _multipart_part_sizes(size: int, parts: int) -> list:
+    """Return the part sizes which split a file of the size into the number of parts."""
+    # Evenly split file with part size rounded up to whole MiB's
+    even_part_size = math.ceil(size / parts / 1024**2) * 1024**2
+    part_sizes = dict.fromkeys(MULTIPART_ETAG_PART_SIZES + (even_part_size,))
+    return [
+        part_size
+        for part_size in part_sizes
+        if part_size > 0 and math.ceil(size / part_size) == parts
+    ]
+
+
+def _multipart_md5(file_path: str, part_size: int) -> str:
+    """Return MD5 hex digest of the part MD5 digests, as in multipart upload ETags."""
+    part_digests = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for part in iter(lambda: f.read(part_size), b""):
+            part_digests.update(hashlib.md5(part).digest())
+    return part_digests.hexdigest()
+
+
+def etag_matches(file_path: str, etag: Optional[str]) -> Optional[bool]:
+    """Check if the file matches the (plain or multipart) MD5 ETag.
+
+    Returns None if the ETag can't be verified (no MD5 ETag or unknown part size).
+    """
+    parsed_etag = _parse_etag(etag)
+    if parsed_etag is None:
+        return None
+    md5, parts = parsed_etag
+    if parts == 0:
+        return file_md5(file_path) == md5
+    part_sizes = _multipart_part_sizes(os.path.getsize(file_path), parts)
+    if not part_sizes:
+        return None
+    return any(_multipart_md5(file_path, part_size) == md5 for part_size in part_sizes)
+
+
+class SegmentedDownload:
+    """Parallel HTTP Range download into a preallocated file.
+
+    Finished segments are written to the '<file>.segments.json' sidecar, so an
+    interrupted download resumes with the missing segments only. Range requests
+    are conditional on the ETag (If-Range) and the ETag of every segment response
+    is compared, so a file changing during the download is never stitched together.
+    Servers ignoring the Range requests get a single stream download instead.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        file_path: str,
+        size: int,
+        etag: Optional[str] = None,
+        segment_size: int = DOWNLOAD_SEGMENT_SIZE,
+        max_workers: int = DOWNLOAD_SEGMENT_WORKERS,
+        callback_func: Optional[ProgressCallback] = None,
+    ):
+        self.url = url
+        self.file_path = file_path
+        self.sidecar_path = f"{file_path}.segments.json"
+        self.size = size
+        self.etag = etag
+        self.segment_size = segment_size
+        self.max_workers = max_workers
+        self.callback_func = callback_func
+        self.lock = threading.Lock()
+        self.segments = [
+            (start, min(start + segment_size, size) - 1)
+            for start in range(0, size, segment_size)
+        ]
+        self.finished = set()
+        self.downloaded_bytes = 0
+        # ETag of the downloaded file, the first response ETag if not given
+        self.response_etag = _normalize_etag(etag)
+
+    def load_state(self):
+        """Load finished segments if the sidecar matches the current download."""
+        try:
+            with open(self.sidecar_path, "r") as sidecar:
+                state = json.load(sidecar)
+        except (OSError, ValueError):
+            return
+        state_etag = state.get("etag")
+        if (
+            state.get("size") == self.size
+            and (self.response_etag is None or state_etag == self.response_etag)
+            and state.get("segment_size") == self.segment_size
+            and os.path.isfile(self.file_path)
+            and os.path.getsize(self.file_path) == self.size
+        ):
+            self.response_etag = state_etag
+            self.finished = set(state.get("finished", [])) & set(
+                range(len(self.segments))
+            )
+
+    def save_state(self):
+        """Write finished segments to the sidecar file."""
+        state = {
+            "size": self.size,
+            "etag": self.response_etag,
+            "segment_size": self.segment_size,
+            "finished": sorted(self.finished),
+        }
+        tmp_path = f"{self.sidecar_path}.tmp"
+        with open(tmp_path, "w") as sidecar:
+            json.dump(state, sidecar)
+        os.replace(tmp_path, self.sidecar_path)
+
+    def add_progress(self, nbytes: int):
+        with self.lock:
+            self.downloaded_bytes += nbytes
+            downloaded_bytes = self.downloaded_bytes
+        if callable(self.callback_func):
+            self.callback_func(downloaded_bytes, self.size)
+
+    def check_response_etag(self, response):
+        """Check that the response is of the same file version as the other segments."""
+        etag = _normalize_etag(response.headers.get("ETag"))
+        if etag is None:
+            return
+        with self.lock:
+            if self.response_etag is None:
+                self.response_etag = etag
+            elif etag != self.response_etag:
+                raise TransferSourceChanged(
+                    f"'{self.file_path}' changed on the server during the download."
+                )
+
+    def download_segment(self, index: int):
+        """Download single byte range and write it at its offset."""
+        start, end = self.segments[index]
+        session = get_session()
+        timeout = (SETTINGS.connect_timeout, SETTINGS.read_timeout)
+        headers = {"Range": f"bytes={start}-{end}"}
+        if self.response_etag is not None:
+            # Full (changed) file is returned instead of the range if the ETag doesn't match
+            headers["If-Range"] = f'"{self.response_etag}"'
+        with session.get(
+            self.url, headers=headers, stream=True, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            self.check_response_etag(response)
+            if response.status_code != 206:
+                raise RangeNotSupported(
+                    f"Server ignored HTTP Range request for '{self.file_path}'."
+                )
+            received = 0
+            with open(self.file_path, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        received += len(chunk)
+                        self.add_progress(len(chunk))
+        if received != end - start + 1:
+            raise TransferVerificationError(
+                f"Incomplete segment {start}-{end} ({received} bytes received)."
+            )
+        with self.lock:
+            self.finished.add(index)
+            self.save_state()
+
+    def verify(self):
+        """Check downloaded file size and (plain or multipart) MD5 ETag."""
+        file_size = os.path.getsize(self.file_path)
+        if file_size != self.size:
+            raise TransferVerificationError(
+                f"Size mismatch: expected {self.size} bytes, got {file_size}."
+            )
+        if etag_matches(self.file_path, self.response_etag) is False:
+            raise TransferVerificationError(
+                f"Checksum mismatch for '{self.file_path}'."
+            )
+
+    def remove_state(self):
+        """Remove the sidecar file, if present."""
+        if os.path.exists(self.sidecar_path):
+            os.remove(self.sidecar_path)
+
+    def single_stream_download(self):
+        """Download the whole file in a single stream."""
+        self.remove_state()
+        with self.lock:
+            self.finished = set()
+            self.downloaded_bytes = 0
+        download_file(self.url, self.file_path, callback_func=self.callback_func)
+
+    def run(self) -> int:
+        """Download missing segments, verify the result and return the file size."""
+        self.load_state()
+        if not self.finished:
+            with open(self.file_path, "wb") as f:
+                f.truncate(self.size)
+            self.save_state()
+        self.add_progress(
+            sum(
+                end - start + 1
+                for index, (start, end) in enumerate(self.segments)
+                if index in self.finished
+            )
+        )
+        pending = [i for i in range(len(self.segments)) if i not in self.finished]
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [executor.submit(self.download_segment, i) for i in pending]
+            for future in as_completed(futures):
+                future.result()
+        except RangeNotSupported:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.single_stream_download()
+        except TransferSourceChanged:
+            # Finished segments are of the previous version, start over next time
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.remove_state()
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            self.verify()
+        finally:
+            self.remove_state()
+        return self.size
+
+
+def segmented_download(
+    url: str,
+    file_path: str,
+    size: int,
+    etag: Optional[str] = None,
+    segment_size: int = DOWNLOAD_SEGMENT_SIZE,
+    max_workers: int = DOWNLOAD_SEGMENT_WORKERS,
+    callback_func: Optional[ProgressCallback] = None,
+) -> int:
+    """Download file in parallel byte ranges, resuming an interrupted download."""
+    return SegmentedDownload(
+        url, file_path, size, etag, segment_size, max_workers, callback_func
+    ).run()
+
+
+def remove_partial_download(file_path: str):
+    """Remove partially downloaded file and its segments sidecar, if present."""
+    for path in (file_path, f"{file_path}.segments.json"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def get_download_file(download, file_path):
+    """Getting file from Download object and writing it under given path."""
+    return download_file(download.get_url, file_path)
+
+
+def upload_local_file(upload, filepath):
+    """Upload file."""
+    return upload_file(upload.put_url, filepath)
@@ -13,6 +13,7 @@ from threedi_models_simulations.schematisation_loader import (
     SchematisationLoader,
     SchematisationLoaderActions,
 )
+from threedi_models_simulations.utils.threedi_api import clear_api_cache
 from threedi_models_simulations.widgets.login import LogInDialog
 from threedi_models_simulations.widgets.schematisation_upload_dialog import (
     SchematisationUploadDialog,
@@ -115,6 +116,7 @@ class DockWidget(QDockWidget, FORM_CLASS):
         self.threedi_api = None
         self.current_user_info = None
         self.organisations.clear()
+        clear_api_cache()
 
         self.label_user.setText("-")
         # set_icon(self.btn_log_in_out, "arrow.svg")
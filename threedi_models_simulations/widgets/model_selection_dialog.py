@@ -40,8 +40,8 @@ from threedi_models_simulations.utils.threedi_api import (
     fetch_models_with_count,
     fetch_schematisation,
     fetch_simulation_templates_with_count,
-    get_download_file,
 )
+from threedi_models_simulations.utils.transfer import get_download_file
 from threedi_models_simulations.widgets.settings import (
     read_3di_settings,
     save_3di_settings,
@@ -32,15 +32,20 @@ from threedi_api_client.openapi import OneDWaterLevel, OneDWaterLevelFile
 from threedi_models_simulations.utils.general import (
     IntDelegate,
     ScientificDoubleDelegate,
-    get_download_file,
 )
-from threedi_models_simulations.utils.msgpack import loadb
+from threedi_models_simulations.utils.initial_waterlevels import (
+    INITIAL_WATERLEVELS_REGISTRY,
+    water_levels_digest,
+)
+from threedi_models_simulations.utils.msgpack import stream_loadb
 from threedi_models_simulations.utils.threedi_api import (
+    ThreediFileState,
     fetch_3di_model_initial_concentrations,
     fetch_model_initial_concentrations_download,
     fetch_model_initial_waterlevels,
     fetch_model_initial_waterlevels_download,
 )
+from threedi_models_simulations.utils.transfer import get_download_file, iter_download
 from threedi_models_simulations.widgets.new_simulation_wizard_pages.utils.duplicate_node_dialog import (
     DuplicateNodeDialog,
 )
@@ -511,33 +516,66 @@ class InitialConditions1DPage(WizardPage):
                 value = float(self.table.item(row, 1).text())
                 table_data[node_id] = value
 
-            for level in self.initial_waterlevels_1d:
+            # if the data in the table is the same as one of the files, we only need to store the file reference
+            threedimodel_id = self.new_sim.simulation.threedimodel_id
+            table_digest = water_levels_digest(table_data.keys(), table_data.values())
+            # Registry entries are pruned against the current levels, not the cached
+            # ones, which can miss levels uploaded in the meantime
+            initial_waterlevels = fetch_model_initial_waterlevels.uncached(
+                self.threedi_api, threedimodel_id
+            )
+            valid_levels = {
+                level.id: level
+                for level in initial_waterlevels
+                if level.dimension == "one_d"
+                and level.file
+                and level.state == ThreediFileState.VALID.value
+            }
+            registered_levels = INITIAL_WATERLEVELS_REGISTRY.model_entries(
+                threedimodel_id
+            )
+            stale_digests = {
+                digest: None
+                for digest, level_id in registered_levels.items()
+                if level_id not in valid_levels
+            }
+            if stale_digests:
+                INITIAL_WATERLEVELS_REGISTRY.update(threedimodel_id, stale_digests)
+                for digest in stale_digests:
+                    del registered_levels[digest]
+            # Files not indexed yet are downloaded once and added to the index
+            indexed_level_ids = set(registered_levels.values())
+            for level in valid_levels.values():
+                if table_digest in registered_levels:
+                    break
+                if level.id in indexed_level_ids:
+                    continue
                 try:
                     # skips this file when not able to retrieve
                     data = self.fetch_level_data_from_api(level)
                 except Exception:
                     continue
+                level_digest = water_levels_digest(data[:, 0], data[:, 1])
+                registered_levels[level_digest] = level.id
+                INITIAL_WATERLEVELS_REGISTRY.register(
+                    threedimodel_id, level_digest, level.id
+                )
 
-                file_data = {}
-                for pair in data:
-                    file_data[int(pair[0])] = float(pair[1])
-
-                # if the data in the table is the same as the selected file, we only need to store the file reference
-                # == operator takes order into account (same dicts with different order are equal)
-                if table_data == file_data:
-                    QgsMessageLog.logMessage(
-                        f"1D water level {level.id} reused",
-                        level=Qgis.Info,
-                    )
+            level = valid_levels.get(registered_levels.get(table_digest))
+            if level is not None:
+                QgsMessageLog.logMessage(
+                    f"1D water level {level.id} reused",
+                    level=Qgis.Info,
+                )
 
-                    # store the selected waterlevel
-                    self.new_sim.initial_1d_water_level_file = OneDWaterLevelFile(
-                        initial_waterlevel=level.url,
-                        initial_waterlevel_id=level.id,
-                    )
-                    self.new_sim.initial_1d_water_level_data = None
-                    self.new_sim.initial_1d_water_level = None
-                    return True
+                # store the selected waterlevel
+                self.new_sim.initial_1d_water_level_file = OneDWaterLevelFile(
+                    initial_waterlevel=level.url,
+                    initial_waterlevel_id=level.id,
+                )
+                self.new_sim.initial_1d_water_level_data = None
+                self.new_sim.initial_1d_water_level = None
+                return True
 
             # Otherwise we store the table itself as well, a new waterlevel file needs to be created
             self.new_sim.initial_1d_water_level_file = None
@@ -557,25 +595,21 @@ class InitialConditions1DPage(WizardPage):
             current_level.id,
             self.new_sim.simulation.threedimodel_id,
         )
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_path = os.path.join(
-                tmpdir, str(current_level.id) + ":" + current_level.file.filename
-            )
-            get_download_file(download, file_path)
-            with open(file_path, "rb") as data_file:
-                extension = Path(file_path).suffix
-                if extension == ".msgpack":
-                    byte_data = data_file.read()
-                    result = loadb(byte_data)
-                    data = np.column_stack((result["node_ids"], result["value"]))
-                    return data
-                elif extension == ".json":
-                    data_str = data_file.read().decode("utf-8")
-                    result = json.loads(data_str)
-                    data = np.column_stack((result["node_ids"], result["values"]))
-                    return data
-                else:
-                    raise Exception(f"file extension {extension} not supported ")
+        extension = Path(current_level.file.filename).suffix
+        # Data is decoded while it is downloaded, without storing the file
+        if extension == ".msgpack":
+            result = stream_loadb(iter_download(download.get_url))
+            values = result["value"] if "value" in result else result["values"]
+        elif extension == ".json":
+            result = json.loads(b"".join(iter_download(download.get_url)))
+            values = result["values"]
+        else:
+            raise Exception(f"file extension {extension} not supported ")
+        node_ids = result["node_ids"]
+        data = np.empty((len(node_ids), 2), dtype=np.float64)
+        data[:, 0] = node_ids
+        data[:, 1] = values
+        return data
 
     def validate_page(self):
         return self.is_complete()
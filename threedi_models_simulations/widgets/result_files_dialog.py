@@ -0,0 +1,164 @@
+from qgis.PyQt.QtCore import QSettings, Qt
+from qgis.PyQt.QtGui import QStandardItem, QStandardItemModel
+from qgis.PyQt.QtWidgets import (
+    QComboBox,
+    QDialog,
+    QGridLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QTreeView,
+)
+
+from threedi_models_simulations.constants import RESULT_FILE_PRESETS
+from threedi_models_simulations.utils.file import format_file_size
+from threedi_models_simulations.utils.threedi_api import filter_simulation_downloads
+
+FILENAME_COLUMN_IDX = 0
+SIZE_COLUMN_IDX = 1
+STATUS_COLUMN_IDX = 2
+
+
+class ResultFilesSelectionDialog(QDialog):
+    """Dialog for picking simulation result files to download."""
+
+    def __init__(self, downloads, up_to_date_filenames, parent):
+        super().__init__(parent)
+
+        self.setWindowModality(Qt.ApplicationModal)
+        self.setWindowTitle("Select result files")
+        self.resize(600, 400)
+
+        self.downloads = downloads
+        self.up_to_date_filenames = set(up_to_date_filenames)
+
+        layout = QGridLayout(self)
+        layout.addWidget(QLabel("Preset:", self), 0, 0)
+        self.preset_cbo = QComboBox(self)
+        self.preset_cbo.addItems(list(RESULT_FILE_PRESETS.keys()))
+        layout.addWidget(self.preset_cbo, 0, 1)
+        layout.addWidget(QLabel("File name patterns:", self), 1, 0)
+        self.patterns_le = QLineEdit(self)
+        self.patterns_le.setToolTip(
+            "Comma separated file name patterns, for example: *.nc, log_files*"
+        )
+        layout.addWidget(self.patterns_le, 1, 1)
+
+        self.files_tv = QTreeView(self)
+        self.files_tv.setEditTriggers(QTreeView.NoEditTriggers)
+        self.files_tv.setRootIsDecorated(False)
+        layout.addWidget(self.files_tv, 2, 0, 1, 2)
+
+        self.total_size_label = QLabel(self)
+        layout.addWidget(self.total_size_label, 3, 0, 1, 2)
+
+        buttons_layout = QGridLayout()
+        self.pb_cancel = QPushButton("Cancel", self)
+        self.pb_cancel.setMinimumSize(125, 30)
+        self.pb_cancel.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        buttons_layout.addWidget(self.pb_cancel, 0, 0)
+        buttons_layout.addItem(
+            QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum), 0, 1
+        )
+        self.pb_download = QPushButton("Download", self)
+        self.pb_download.setMinimumSize(125, 30)
+        self.pb_download.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        buttons_layout.addWidget(self.pb_download, 0, 2)
+        layout.addLayout(buttons_layout, 4, 0, 1, 2)
+
+        self.files_model = QStandardItemModel()
+        self.files_model.setHorizontalHeaderLabels(["File name", "Size", "Status"])
+        self.files_tv.setModel(self.files_model)
+        self.populate_files()
+
+        last_preset = QSettings().value(
+            "threedi/last_result_files_preset", "All files", type=str
+        )
+        if last_preset in RESULT_FILE_PRESETS:
+            self.preset_cbo.setCurrentText(last_preset)
+        self.apply_preset()
+
+        self.preset_cbo.currentTextChanged.connect(self.apply_preset)
+        self.patterns_le.editingFinished.connect(self.apply_patterns)
+        self.files_model.itemChanged.connect(self.update_total_size)
+        self.pb_cancel.clicked.connect(self.reject)
+        self.pb_download.clicked.connect(self.accept)
+
+    def populate_files(self):
+        """Populate result files with their sizes."""
+        for result_file, download in self.downloads:
+            filename_item = QStandardItem(result_file.filename)
+            filename_item.setCheckable(True)
+            filename_item.setEditable(False)
+            size_item = QStandardItem(format_file_size(download.size))
+            size_item.setData(download.size, Qt.UserRole)
+            size_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            up_to_date = result_file.filename in self.up_to_date_filenames
+            status_item = QStandardItem("Up to date" if up_to_date else "")
+            self.files_model.appendRow([filename_item, size_item, status_item])
+        for column_idx in range(self.files_model.columnCount()):
+            self.files_tv.resizeColumnToContents(column_idx)
+
+    def apply_preset(self):
+        """Fill in patterns of the selected preset and check matching files."""
+        patterns = RESULT_FILE_PRESETS[self.preset_cbo.currentText()]
+        self.patterns_le.setText(", ".join(patterns))
+        self.apply_patterns()
+
+    def apply_patterns(self):
+        """Check result files matching the file name patterns."""
+        patterns = self.patterns_le.text().split(",")
+        matching_filenames = {
+            result_file.filename
+            for result_file, _ in filter_simulation_downloads(self.downloads, patterns)
+        }
+        self.files_model.blockSignals(True)
+        for row_idx in range(self.files_model.rowCount()):
+            filename_item = self.files_model.item(row_idx, FILENAME_COLUMN_IDX)
+            check_state = (
+                Qt.Checked
+                if filename_item.text() in matching_filenames
+                else Qt.Unchecked
+            )
+            filename_item.setCheckState(check_state)
+        self.files_model.blockSignals(False)
+        self.files_tv.viewport().update()
+        self.update_total_size()
+
+    def update_total_size(self):
+        """Show the total size of the selected files that need to be downloaded."""
+        total_size, files_count = 0, 0
+        for row_idx in range(self.files_model.rowCount()):
+            filename_item = self.files_model.item(row_idx, FILENAME_COLUMN_IDX)
+            if filename_item.checkState() != Qt.Checked:
+                continue
+            if filename_item.text() in self.up_to_date_filenames:
+                continue
+            size_item = self.files_model.item(row_idx, SIZE_COLUMN_IDX)
+            total_size += size_item.data(Qt.UserRole)
+            files_count += 1
+        self.total_size_label.setText(
+            f"Files to download: {files_count} ({format_file_size(total_size)})"
+        )
+
+    def selected_downloads(self):
+        """Return downloads of the checked result files."""
+        checked_filenames = {
+            self.files_model.item(row_idx, FILENAME_COLUMN_IDX).text()
+            for row_idx in range(self.files_model.rowCount())
+            if self.files_model.item(row_idx, FILENAME_COLUMN_IDX).checkState()
+            == Qt.Checked
+        }
+        return [
+            (result_file, download)
+            for result_file, download in self.downloads
+            if result_file.filename in checked_filenames
+        ]
+
+    def accept(self):
+        QSettings().setValue(
+            "threedi/last_result_files_preset", self.preset_cbo.currentText()
+        )
+        super().accept()
@@ -34,8 +34,8 @@ from threedi_models_simulations.utils.threedi_api import (
     fetch_schematisation_revision_models,
     fetch_schematisation_revisions_with_count,
     fetch_schematisations_with_count,
-    get_download_file,
 )
+from threedi_models_simulations.utils.transfer import get_download_file
 
 
 class SchematisationDownloadDialog(QDialog):
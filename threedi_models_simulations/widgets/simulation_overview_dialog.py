@@ -39,7 +39,10 @@ from threedi_models_simulations.widgets.utils.simulation_progress_delegate impor
     PROGRESS_ROLE,
     SimulationProgressDelegate,
 )
-from threedi_models_simulations.workers.runner import SimulationRunner
+from threedi_models_simulations.workers.runner import (
+    SimulationBatchRunner,
+    SimulationRunner,
+)
 from threedi_models_simulations.workers.simulations import SimulationStatusName
 
 
@@ -47,7 +50,7 @@ class SimulationOverviewDialog(QDialog):
     """Dialog with methods for handling running simulations."""
 
     PROGRESS_COLUMN_IDX = 1
-    MAX_THREAD_COUNT = 1
+    MAX_THREAD_COUNT = 4
 
     refresh_requested = pyqtSignal()
 
@@ -347,6 +350,26 @@ class SimulationOverviewDialog(QDialog):
         )
         self.simulation_runner_pool.start(simulations_runner)
 
+    def start_simulations(self, new_sims):
+        """Start multiple simulations sharing their uploaded files."""
+        if len(new_sims) == 1:
+            self.start_simulation(new_sims[0])
+            return
+        upload_timeout = QSettings().value("threedi/timeout", 900, type=int)
+        simulations_runner = SimulationBatchRunner(
+            self.threedi_api, new_sims, upload_timeout=upload_timeout
+        )
+        simulations_runner.signals.initializing_simulations_progress.connect(
+            self.on_initializing_progress
+        )
+        simulations_runner.signals.initializing_simulations_failed.connect(
+            self.on_initializing_failed
+        )
+        simulations_runner.signals.initializing_simulations_finished.connect(
+            self.on_initializing_finished
+        )
+        self.simulation_runner_pool.start(simulations_runner)
+
     def stop_simulation(self, index):
         """Sending request to shut down currently selected simulation."""
         if not index.isValid():
@@ -40,7 +40,13 @@ from threedi_models_simulations.constants import (
     ICONS_DIR,
     USER_DATETIME_FORMAT,
 )
-from threedi_models_simulations.utils.file import translate_illegal_chars
+from threedi_models_simulations.utils.file import (
+    download_manifest_entry,
+    is_download_up_to_date,
+    read_download_manifest,
+    translate_illegal_chars,
+    write_download_manifest,
+)
 from threedi_models_simulations.utils.threedi_api import (
     expiration_time,
     extract_error_message,
@@ -50,6 +56,9 @@ from threedi_models_simulations.utils.threedi_api import (
     fetch_simulation,
     fetch_simulation_downloads,
 )
+from threedi_models_simulations.widgets.result_files_dialog import (
+    ResultFilesSelectionDialog,
+)
 from threedi_models_simulations.widgets.utils.download_progress_delegate import (
     DownloadProgressDelegate,
 )
@@ -60,6 +69,7 @@ EXPIRES_COLUMN_IDX = 1
 USERNAME_COLUMN_IDX = 2
 PROGRESS_COLUMN_IDX = 3
 MAX_THREAD_COUNT = 4
+GRID_FILE_NAMES = ["gridadmin.h5", "gridadmin.gpkg"]
 
 
 class SortFilterProxyModel(QSortFilterProxyModel):
@@ -162,6 +172,7 @@ class SimulationResultDialog(QDialog):
         self.finished_simulations = {}
         self.download_progress_bars = {}
         self.running_downloads = set()
+        self.download_workers = {}
         self.tv_model = None
         self.setup_view_model()
 
@@ -301,26 +312,83 @@ class SimulationResultDialog(QDialog):
     def on_download_finished_success(self, msg, results_dir, sim_id):
         """Reporting finish successfully status and closing download thread."""
         self.running_downloads.remove(sim_id)
+        self.download_workers.pop(sim_id, None)
         self.communication.bar_info(msg, log_text_color=Qt.darkGreen)
 
-        grid_file_names = ["gridadmin.h5", "gridadmin.gpkg"]
-        grid_dir = os.path.join(os.path.dirname(os.path.dirname(results_dir)), "grid")
+        grid_dir = self.get_grid_dir(results_dir)
         if os.path.exists(grid_dir):
-            for grid_file_name in grid_file_names:
+            results_manifest = read_download_manifest(results_dir)
+            grid_manifest = read_download_manifest(grid_dir)
+            for grid_file_name in GRID_FILE_NAMES:
                 grid_file = os.path.join(results_dir, grid_file_name)
                 if os.path.exists(grid_file):
                     grid_file_copy = os.path.join(grid_dir, grid_file_name)
                     shutil.copyfile(
                         grid_file, bypass_max_path_limit(grid_file_copy, is_file=True)
                     )
+                    if grid_file_name in results_manifest:
+                        grid_manifest[grid_file_name] = results_manifest[grid_file_name]
+                    else:
+                        grid_manifest.pop(grid_file_name, None)
+            write_download_manifest(grid_dir, grid_manifest)
         self.toggle_refresh_results()
 
     def on_download_finished_failed(self, msg, sim_id):
         """Reporting failure and closing download thread."""
         self.running_downloads.remove(sim_id)
+        self.download_workers.pop(sim_id, None)
         self.communication.bar_error(msg, log_text_color=Qt.red)
         self.toggle_refresh_results()
 
+    @staticmethod
+    def get_grid_dir(results_dir):
+        """Return revision grid directory belonging to the simulation results directory."""
+        return os.path.join(os.path.dirname(os.path.dirname(results_dir)), "grid")
+
+    def find_up_to_date_filenames(self, downloads, results_dir):
+        """Return names of result files that don't need to be downloaded again."""
+        manifest = read_download_manifest(results_dir)
+        grid_dir = self.get_grid_dir(results_dir)
+        grid_manifest = read_download_manifest(grid_dir)
+        up_to_date_filenames = set()
+        for result_file, download in downloads:
+            filename = result_file.filename
+            if is_download_up_to_date(results_dir, filename, download, manifest) or (
+                filename in GRID_FILE_NAMES
+                and is_download_up_to_date(grid_dir, filename, download, grid_manifest)
+            ):
+                up_to_date_filenames.add(filename)
+        return up_to_date_filenames
+
+    def filter_outdated_downloads(self, downloads, results_dir):
+        """Return downloads that are missing or changed in the results directory.
+
+        Grid files that are up to date in the revision grid directory are copied instead of downloaded.
+        """
+        manifest = read_download_manifest(results_dir)
+        grid_dir = self.get_grid_dir(results_dir)
+        grid_manifest = read_download_manifest(grid_dir)
+        outdated_downloads = []
+        for result_file, download in downloads:
+            filename = result_file.filename
+            if is_download_up_to_date(results_dir, filename, download, manifest):
+                continue
+            if filename in GRID_FILE_NAMES and is_download_up_to_date(
+                grid_dir, filename, download, grid_manifest
+            ):
+                os.makedirs(results_dir, exist_ok=True)
+                shutil.copyfile(
+                    os.path.join(grid_dir, filename),
+                    bypass_max_path_limit(
+                        os.path.join(results_dir, filename), is_file=True
+                    ),
+                )
+                manifest[filename] = download_manifest_entry(download)
+                write_download_manifest(results_dir, manifest)
+                continue
+            outdated_downloads.append((result_file, download))
+        return outdated_downloads
+
     def pick_results_destination_dir(self):
         """Pick folder where results will be written to."""
         last_folder = QSettings().value(
@@ -435,6 +503,23 @@ class SimulationResultDialog(QDialog):
             if gridadmin_downloads_gpkg is not None:
                 downloads.append(gridadmin_downloads_gpkg)
             downloads.sort(key=lambda x: x[-1].size)
+            up_to_date_filenames = self.find_up_to_date_filenames(
+                downloads, simulation_subdirectory_path
+            )
+            selection_dialog = ResultFilesSelectionDialog(
+                downloads, up_to_date_filenames, self
+            )
+            if selection_dialog.exec_() != QDialog.Accepted:
+                return
+            selected_downloads = selection_dialog.selected_downloads()
+            downloads = self.filter_outdated_downloads(
+                selected_downloads, simulation_subdirectory_path
+            )
+            up_to_date_count = len(selected_downloads) - len(downloads)
+            if up_to_date_count:
+                self.communication.bar_info(
+                    f"{up_to_date_count} of {len(selected_downloads)} result file(s) already up to date, skipping."
+                )
         except ApiException as e:
             error_msg = extract_error_message(e)
             self.communication.show_error(error_msg, self, "Error")
@@ -457,4 +542,16 @@ class SimulationResultDialog(QDialog):
         )
         self.download_results_pool.start(download_worker)
         self.running_downloads.add(sim_id)
+        self.download_workers[sim_id] = download_worker
         self.toggle_refresh_results()
+
+    def reject(self):
+        """Cancel running downloads (after confirmation) when closing the dialog."""
+        if self.download_workers:
+            question = "Do you want to cancel the running downloads?"
+            yes = self.communication.ask(self, "Cancel downloads?", question)
+            if not yes:
+                return
+            for download_worker in self.download_workers.values():
+                download_worker.stop_download()
+        super().reject()
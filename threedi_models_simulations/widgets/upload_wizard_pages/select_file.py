@@ -21,8 +21,9 @@ from qgis.PyQt.QtWidgets import (
 from threedi_api_client.openapi import ApiException
 
 from threedi_models_simulations.utils.file import (
+    cached_archive,
+    calculate_checksums,
     is_file_checksum_equal,
-    zip_into_archive,
 )
 from threedi_models_simulations.utils.general import (
     get_filepath,
@@ -198,23 +199,21 @@ class SelectFilesWidget(QWidget):
             remote_rasters_by_type["dem_file"] = remote_rasters_by_type["dem_raw_file"]
             del remote_rasters_by_type["dem_raw_file"]
         geopackage_dir = os.path.dirname(self.schematisation_filepath)
+        rasters_to_compare = {}
         if self.latest_revision.sqlite:
             try:
-                zipped_schematisation_db = zip_into_archive(
+                _, zipped_schematisation_db_md5 = cached_archive(
                     self.schematisation_filepath
                 )
                 sqlite_download = download_schematisation_revision_sqlite(
                     self.threedi_api, self.schematisation.id, self.latest_revision.id
                 )
-                files_matching = is_file_checksum_equal(
-                    zipped_schematisation_db, sqlite_download.etag
-                )
+                files_matching = zipped_schematisation_db_md5 == sqlite_download.etag
                 status = (
                     UploadFileStatus.NO_CHANGES_DETECTED
                     if files_matching
                     else UploadFileStatus.CHANGES_DETECTED
                 )
-                os.remove(zipped_schematisation_db)
             except ApiException:
                 status = UploadFileStatus.CHANGES_DETECTED
         else:
@@ -252,14 +251,9 @@ class SelectFilesWidget(QWidget):
                 if filepath:
                     if os.path.exists(filepath):
                         if remote_raster and remote_raster.file:
-                            files_matching = is_file_checksum_equal(
-                                filepath, remote_raster.file.etag
-                            )
-                            status = (
-                                UploadFileStatus.NO_CHANGES_DETECTED
-                                if files_matching
-                                else UploadFileStatus.CHANGES_DETECTED
-                            )
+                            # Status is resolved below, when all rasters are hashed
+                            rasters_to_compare[file_field] = filepath
+                            status = UploadFileStatus.CHANGES_DETECTED
                         else:
                             status = UploadFileStatus.NEW
                     else:
@@ -273,6 +267,13 @@ class SelectFilesWidget(QWidget):
                     "remote_raster": remote_raster,
                     "make_action": True,
                 }
+        checksums = calculate_checksums(list(rasters_to_compare.values()))
+        for file_field, filepath in rasters_to_compare.items():
+            remote_raster = files_states[file_field]["remote_raster"]
+            if checksums[filepath] == remote_raster.file.etag:
+                files_states[file_field]["status"] = (
+                    UploadFileStatus.NO_CHANGES_DETECTED
+                )
         return files_states
 
     def initialize_widgets(self):
@@ -1,11 +1,27 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
 from qgis.PyQt.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
 from threedi_mi_utils import bypass_max_path_limit
 
-from threedi_models_simulations.constants import DOWNLOAD_CHUNK_SIZE
-from threedi_models_simulations.utils.file import unzip_archive
+from threedi_models_simulations.constants import (
+    DOWNLOAD_MAX_WORKERS,
+    SEGMENTED_DOWNLOAD_THRESHOLD,
+)
+from threedi_models_simulations.utils.file import (
+    download_manifest_entry,
+    read_download_manifest,
+    unzip_archive,
+    write_download_manifest,
+)
+from threedi_models_simulations.utils.transfer import (
+    TransferCanceled,
+    TransferVerificationError,
+    download_file,
+    remove_partial_download,
+    segmented_download,
+)
 
 
 class DownloadWorkerSignals(QObject):
@@ -25,14 +41,80 @@ class DownloadProgressWorker(QRunnable):
     FINISHED = 100
     FAILED = 101
 
-    def __init__(self, simulation, downloads, directory):
+    def __init__(
+        self, simulation, downloads, directory, max_workers=DOWNLOAD_MAX_WORKERS
+    ):
         super().__init__()
         self.simulation = simulation
         self.simulation_id = simulation.id
         self.downloads = downloads
         self.directory = bypass_max_path_limit(directory)
+        self.max_workers = max_workers
         self.success = True
         self.signals = DownloadWorkerSignals()
+        self.progress_lock = threading.Lock()
+        self.downloaded_bytes = {}
+        self.total_size = 0
+        self.cancel_event = threading.Event()
+        self.manifest = {}
+
+    def stop_download(self):
+        """Cancel all running and pending file downloads."""
+        self.cancel_event.set()
+
+    def report_download_progress(self, filename, downloaded_bytes):
+        """Combine bytes downloaded by all streams and emit overall progress."""
+        if self.cancel_event.is_set():
+            raise TransferCanceled(f"Downloading of '{filename}' canceled")
+        with self.progress_lock:
+            self.downloaded_bytes[filename] = downloaded_bytes
+            size = sum(self.downloaded_bytes.values())
+        if self.total_size:
+            self.signals.download_progress.emit(
+                size / self.total_size * 100, self.simulation_id
+            )
+
+    def download_result_file(self, result_file, download):
+        """Download single result file and unzip it if needed."""
+        filename = result_file.filename
+        if self.cancel_event.is_set():
+            raise TransferCanceled(f"Downloading of '{filename}' canceled")
+        filename_path = bypass_max_path_limit(
+            os.path.join(self.directory, filename), is_file=True
+        )
+
+        def monitor_download_progress(downloaded_bytes, _total_bytes):
+            self.report_download_progress(filename, downloaded_bytes)
+
+        if download.size >= SEGMENTED_DOWNLOAD_THRESHOLD:
+            # Large files are kept on failure, their finished segments are resumed,
+            # unless the downloaded file turned out to be corrupt
+            try:
+                segmented_download(
+                    download.get_url,
+                    filename_path,
+                    download.size,
+                    etag=download.etag,
+                    callback_func=monitor_download_progress,
+                )
+            except TransferVerificationError:
+                remove_partial_download(filename_path)
+                raise
+        else:
+            try:
+                download_file(
+                    download.get_url,
+                    filename_path,
+                    callback_func=monitor_download_progress,
+                )
+            except Exception:
+                remove_partial_download(filename_path)
+                raise
+        if filename.lower().endswith(".zip"):
+            unzip_archive(filename_path)
+        with self.progress_lock:
+            self.manifest[filename] = download_manifest_entry(download)
+            write_download_manifest(self.directory, self.manifest)
 
     @pyqtSlot()
     def run(self):
@@ -44,35 +126,46 @@ class DownloadProgressWorker(QRunnable):
             )
         else:
             finished_message = "Nothing to download!"
-        total_size = sum(download.size for result_file, download in self.downloads)
-        size = 0
-        self.signals.download_progress.emit(size, self.simulation_id)
-        for result_file, download in self.downloads:
-            filename = result_file.filename
-            filename_path = bypass_max_path_limit(
-                os.path.join(self.directory, filename), is_file=True
+        self.total_size = sum(download.size for result_file, download in self.downloads)
+        self.signals.download_progress.emit(0, self.simulation_id)
+        error_msg = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Files being replaced are dropped from the manifest until they are downloaded again
+            self.manifest = read_download_manifest(self.directory)
+            for result_file, download in self.downloads:
+                self.manifest.pop(result_file.filename, None)
+            write_download_manifest(self.directory, self.manifest)
+            # Start with the largest files, so they don't hold back the rest at the end
+            downloads = sorted(
+                self.downloads, key=lambda item: item[-1].size, reverse=True
             )
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
             try:
-                os.makedirs(self.directory, exist_ok=True)
-                file_data = requests.get(download.get_url, stream=True, timeout=15)
-                with open(filename_path, "wb") as f:
-                    for chunk in file_data.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-                        if chunk:
-                            f.write(chunk)
-                            size += len(chunk)
-                            self.signals.download_progress.emit(
-                                size / total_size * 100, self.simulation_id
-                            )
-                if filename.lower().endswith(".zip"):
-                    unzip_archive(filename_path)
-                continue
-            except Exception as e:
-                error_msg = f"Error: {e}"
+                futures = [
+                    executor.submit(self.download_result_file, result_file, download)
+                    for result_file, download in downloads
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except TransferCanceled:
+                        pass
+                    except Exception as e:
+                        if error_msg is None:
+                            error_msg = f"Error: {e}"
+                        self.cancel_event.set()
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if error_msg is None and self.cancel_event.is_set():
+                error_msg = "Downloading canceled"
+        except Exception as e:
+            error_msg = f"Error: {e}"
+        if error_msg is not None:
+            self.success = False
             self.signals.download_progress.emit(self.FAILED, self.simulation_id)
             self.signals.download_failed.emit(error_msg, self.simulation_id)
-            self.success = False
-            break
-        if self.success is True:
+        else:
             self.signals.download_progress.emit(self.FINISHED, self.simulation_id)
             self.signals.thread_finished.emit(
                 finished_message, self.directory, self.simulation_id
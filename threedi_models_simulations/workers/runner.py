@@ -1,18 +1,30 @@
 import os
 import tempfile
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
+import numpy as np
 from qgis.core import Qgis, QgsMessageLog
-from qgis.PyQt.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from qgis.PyQt.QtCore import QObject, QRunnable, Qt, pyqtSignal, pyqtSlot
 from threedi_api_client.openapi import ApiException
 
-from threedi_models_simulations.constants import CACHE_PATH, RADAR_ID
+from threedi_models_simulations.constants import (
+    CACHE_PATH,
+    RADAR_ID,
+    SIMULATION_BATCH_MAX_WORKERS,
+    SIMULATION_SUBMISSION_MAX_WORKERS,
+)
 from threedi_models_simulations.utils.general import (
-    get_download_file,
-    upload_local_file,
     write_json_data,
+    write_msgpack_data,
+)
+from threedi_models_simulations.utils.initial_waterlevels import (
+    INITIAL_WATERLEVELS_REGISTRY,
+    water_levels_digest,
 )
 from threedi_models_simulations.utils.model import NewSimulation
+from threedi_models_simulations.utils.polling import PollTimeoutError, wait_for
 from threedi_models_simulations.utils.threedi_api import (
     RainEventTypes,
     ThreediFileState,
@@ -29,6 +41,7 @@ from threedi_models_simulations.utils.threedi_api import (
     create_simulation_settings_time_step,
     create_simulation_settings_water_quality,
     create_template_from_simulation,
+    delete_initial_water_level,
     delete_simulation_initial_1d_water_level_file,
     extract_error_message,
     fetch_model_initial_waterlevel,
@@ -36,23 +49,48 @@ from threedi_models_simulations.utils.threedi_api import (
     fetch_simulation_status,
     upload_initial_water_level,
 )
-
-TEMPLATE_PATH = os.path.join(CACHE_PATH, "templates.json")
-INITIAL_WATERLEVELS_TEMPLATE = os.path.join(CACHE_PATH, "initial_waterlevels.json")
-INITIAL_CONCENTRATIONS_TEMPLATE = os.path.join(
-    CACHE_PATH, "initial_concentrations.json"
+from threedi_models_simulations.utils.transfer import (
+    get_download_file,
+    upload_local_file,
 )
-BOUNDARY_CONDITIONS_TEMPLATE = os.path.join(CACHE_PATH, "boundary_conditions.json")
-LATERALS_FILE_TEMPLATE = os.path.join(CACHE_PATH, "laterals.json")
-DWF_FILE_TEMPLATE = os.path.join(CACHE_PATH, "dwf.json")
 
-TEMPDIR = tempfile.gettempdir()
+TEMPLATE_PATH = os.path.join(CACHE_PATH, "templates.json")
+# Files written by runners are placed in the separate workspace of each run
+INITIAL_WATERLEVELS_TEMPLATE = "initial_waterlevels.json"
+INITIAL_WATERLEVELS_MSGPACK_TEMPLATE = "initial_waterlevels.msgpack"
+INITIAL_CONCENTRATIONS_TEMPLATE = "initial_concentrations.json"
+BOUNDARY_CONDITIONS_TEMPLATE = "boundary_conditions.json"
+LATERALS_FILE_TEMPLATE = "laterals.json"
+DWF_FILE_TEMPLATE = "dwf.json"
+WORKSPACE_PREFIX = "threedi_simulation_"
 
 
 class SimulationRunnerError(Exception):
     pass
 
 
+class SimulationRunnerFileError(SimulationRunnerError):
+    """Exception raised when uploaded file is marked as invalid by the server."""
+
+
+class SharedArtifacts:
+    """Thread-safe registry of artifacts uploaded once and reused by multiple simulations."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self.artifacts = {}
+
+    def get_or_create(self, key, create_artifact):
+        """Return artifact stored under the key, creating it first if needed."""
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self.artifacts:
+                self.artifacts[key] = create_artifact()
+            return self.artifacts[key]
+
+
 class SimulationRunnerSignals(QObject):
     """Definition of the simulation runner signals."""
 
@@ -67,17 +105,83 @@ class SimulationRunnerSignals(QObject):
 class SimulationRunner(QRunnable):
     """Worker object responsible for running simulations."""
 
-    def __init__(self, threedi_api, new_sim, upload_timeout=900):
+    # Switched off for the rest of the session once the server rejects the msgpack format
+    msgpack_water_levels_accepted = True
+
+    def __init__(
+        self,
+        threedi_api,
+        new_sim,
+        upload_timeout=900,
+        max_workers=SIMULATION_SUBMISSION_MAX_WORKERS,
+        shared_artifacts=None,
+    ):
         super().__init__()
         self.threedi_api = threedi_api
         self.new_sim = new_sim
         self.upload_timeout = upload_timeout
+        self.max_workers = max_workers
+        self.shared_artifacts = (
+            shared_artifacts if shared_artifacts is not None else SharedArtifacts()
+        )
+        self.workspace = None
         self.signals = SimulationRunnerSignals()
         self.total_progress = 100
         self.steps_per_simulation = 10
         self.current_step = 0
         self.percentage_per_step = self.total_progress / self.steps_per_simulation
 
+    def workspace_path(self, filename):
+        """Return path of the file within the workspace of the current run."""
+        return os.path.join(self.workspace, filename)
+
+    def wait_for_file_processing(self, fetch_uploaded_file, resource, file_description):
+        """Wait until the uploaded file is processed (its state is "valid")."""
+
+        def check_file_state():
+            uploaded_file = fetch_uploaded_file()
+            if uploaded_file.state == ThreediFileState.VALID.value:
+                return uploaded_file
+            elif uploaded_file.state == ThreediFileState.INVALID.value:
+                state_detail = str(uploaded_file.state_detail).strip("{}").strip()
+                err_msg = f"Failed to upload {file_description} file due to the following reasons: {state_detail}"
+                raise SimulationRunnerFileError(err_msg)
+            return None
+
+        try:
+            return wait_for(check_file_state, resource, timeout=self.upload_timeout)
+        except PollTimeoutError:
+            err_msg = f"Failed to upload {file_description} file: processing didn't finish within {self.upload_timeout} seconds."
+            raise SimulationRunnerError(err_msg)
+
+    def submit_concurrently(self, requests, on_done=None):
+        """Run independent API requests concurrently and return their results in order.
+
+        All requests are awaited before returning, the first raised exception is re-raised
+        and requests that didn't start yet are canceled. The on_done callback is called
+        (in the calling thread) after each successfully completed request.
+        """
+        if len(requests) < 2 or self.max_workers < 2:
+            results = []
+            for request in requests:
+                results.append(request())
+                if on_done is not None:
+                    on_done()
+            return results
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(request) for request in requests]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    for not_done_future in futures:
+                        not_done_future.cancel()
+                    break
+                if on_done is not None:
+                    on_done()
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        return [future.result() for future in futures]
+
     def create_simulation(self):
         """Create a new simulation out of the NewSimulation data model."""
         simulation = create_simulation(
@@ -198,6 +302,96 @@ class SimulationRunner(QRunnable):
             }
             self.tc.create_obstacle_edits(sim_id, **obstacle_edit_data)
 
+    def upload_initial_1d_water_levels(
+        self, threedimodel_id, sim_name, upload_data, digest
+    ):
+        """Upload initial 1D water levels file to the model and return its ID.
+
+        Upload is skipped if the same water levels were already uploaded to the model.
+        """
+        initial_waterlevel_id = INITIAL_WATERLEVELS_REGISTRY.find_valid(
+            self.threedi_api, threedimodel_id, digest
+        )
+        if initial_waterlevel_id is not None:
+            QgsMessageLog.logMessage(f"1D water level {initial_waterlevel_id} reused")
+            return initial_waterlevel_id
+        if SimulationRunner.msgpack_water_levels_accepted:
+            # Msgpack is much smaller and faster to write for the large models,
+            # array's are packed with the default (np.save) ext_type the server parses
+            msgpack_data = {
+                "node_ids": np.array(upload_data["node_ids"], dtype=np.int64),
+                "value": np.array(upload_data["values"], dtype=np.float64),
+            }
+            filepath = self.workspace_path(INITIAL_WATERLEVELS_MSGPACK_TEMPLATE)
+            write_msgpack_data(msgpack_data, filepath)
+            try:
+                initial_waterlevel_id = self.upload_initial_1d_water_levels_file(
+                    threedimodel_id, sim_name, filepath
+                )
+            except ApiException as e:
+                # Only a rejected msgpack file is retried as JSON, invalid water
+                # levels would be rejected in any format
+                if e.status != 400:
+                    raise
+                QgsMessageLog.logMessage(
+                    f"Msgpack 1D water levels not accepted, falling back to JSON: {e}",
+                    level=Qgis.Warning,
+                )
+                SimulationRunner.msgpack_water_levels_accepted = False
+        if initial_waterlevel_id is None:
+            filepath = self.workspace_path(INITIAL_WATERLEVELS_TEMPLATE)
+            write_json_data(upload_data, filepath)
+            initial_waterlevel_id = self.upload_initial_1d_water_levels_file(
+                threedimodel_id, sim_name, filepath
+            )
+        INITIAL_WATERLEVELS_REGISTRY.register(
+            threedimodel_id, digest, initial_waterlevel_id
+        )
+        return initial_waterlevel_id
+
+    def upload_initial_1d_water_levels_file(self, threedimodel_id, sim_name, filepath):
+        """Upload initial 1D water levels file to the model and wait for its processing."""
+        # Steps to upload initial 1D water levels file
+        # Step 1: Create a new initial water level instance for this model
+        initial_waterlevel_instance = create_initial_water_level(
+            self.threedi_api, threedimodel_id, dimension="one_d"
+        )
+        initial_waterlevel_id = initial_waterlevel_instance.id
+        try:
+            # Step 2: Create an upload instance for the initial waterl level
+            extension = os.path.splitext(filepath)[-1]
+            filename = (
+                f"{initial_waterlevel_id}_{sim_name}_1d_initial_waterlevels{extension}"
+            )
+            initial_waterlevel_upload = upload_initial_water_level(
+                self.threedi_api,
+                threedimodel_id,
+                initial_waterlevel_id,
+                filename=filename,
+            )
+            upload_local_file(initial_waterlevel_upload, filepath)
+            # Step 3: Wait for the data to be processed (initial_waterlevel.state == "valid")
+            self.wait_for_file_processing(
+                lambda: fetch_model_initial_waterlevel(
+                    self.threedi_api, threedimodel_id, initial_waterlevel_id
+                ),
+                f"initial_waterlevel:{initial_waterlevel_id}",
+                "Initial Waterlevel",
+            )
+        except Exception:
+            # Don't leave the rejected (or invalid) initial water level on the model
+            try:
+                delete_initial_water_level(
+                    self.threedi_api, threedimodel_id, initial_waterlevel_id
+                )
+            except ApiException as e:
+                QgsMessageLog.logMessage(
+                    f"Failed to delete initial water level {initial_waterlevel_id}: {e}",
+                    level=Qgis.Warning,
+                )
+            raise
+        return initial_waterlevel_id
+
     def include_substances(self):
         """Add substances to the new simulation."""
         sim_id = self.current_simulation.simulation.id
@@ -220,16 +414,11 @@ class SimulationRunner(QRunnable):
                 sim_id, filename=filename
             )
             upload_local_file(bc_upload, filepath)
-            for ti in range(int(self.upload_timeout // 2)):
-                uploaded_bc = self.tc.fetch_boundarycondition_files(sim_id)[0]
-                if uploaded_bc.state == ThreediFileState.VALID.value:
-                    break
-                elif uploaded_bc.state == ThreediFileState.INVALID.value:
-                    state_detail = str(uploaded_bc.state_detail).strip("{}").strip()
-                    err_msg = f"Failed to upload Boundary Conditions file due to the following reasons: {state_detail}"
-                    raise SimulationRunnerError(err_msg)
-                else:
-                    time.sleep(2)
+            self.wait_for_file_processing(
+                lambda: self.tc.fetch_boundarycondition_files(sim_id)[0],
+                f"simulation:{sim_id}",
+                "Boundary Conditions",
+            )
 
         if boundary_conditions.data:
             boundary_conditions_data = boundary_conditions.data
@@ -241,9 +430,14 @@ class SimulationRunner(QRunnable):
                         if substance_name in self.substances:
                             substance_id = self.substances[substance_name]
                             substance["substance"] = substance_id
-            write_json_data(boundary_conditions_data, BOUNDARY_CONDITIONS_TEMPLATE)
+            write_json_data(
+                boundary_conditions_data,
+                self.workspace_path(BOUNDARY_CONDITIONS_TEMPLATE),
+            )
             bc_file_name = f"{sim_name}_boundary_conditions.json"
-            upload_file_boundary_conditions(bc_file_name, BOUNDARY_CONDITIONS_TEMPLATE)
+            upload_file_boundary_conditions(
+                bc_file_name, self.workspace_path(BOUNDARY_CONDITIONS_TEMPLATE)
+            )
 
     def include_structure_controls(self):
         """Apply structure controls to the new simulation."""
@@ -257,20 +451,14 @@ class SimulationRunner(QRunnable):
                 sim_id, filename=filename, offset=offset
             )
             upload_local_file(sc_upload, filepath)
-            for ti in range(int(self.upload_timeout // 2)):
-                uploaded_files = {
+            self.wait_for_file_processing(
+                lambda: {
                     scf.file.filename: scf
                     for scf in self.tc.fetch_structure_control_files(sim_id)
-                }
-                uploaded_sc = uploaded_files[sc_upload.filename]
-                if uploaded_sc.state == ThreediFileState.VALID.value:
-                    break
-                elif uploaded_sc.state == ThreediFileState.INVALID.value:
-                    state_detail = str(uploaded_sc.state_detail).strip("{}").strip()
-                    err_msg = f"Failed to upload Structure Controls file due to the following reasons: {state_detail}"
-                    raise SimulationRunnerError(err_msg)
-                else:
-                    time.sleep(2)
+                }[sc_upload.filename],
+                f"simulation:{sim_id}",
+                "Structure Controls",
+            )
 
         if structure_controls.file_structure_controls:
             sc_file = structure_controls.file_structure_controls
@@ -279,10 +467,9 @@ class SimulationRunner(QRunnable):
             )
             sc_file_name = sc_file.file.filename
             sc_file_offset = sc_file.offset
-            sc_filepath = os.path.join(TEMPDIR, sc_file_name)
+            sc_filepath = self.workspace_path(sc_file_name)
             get_download_file(sc_file_download, sc_filepath)
             upload_file_structure_controls(sc_file_name, sc_filepath, sc_file_offset)
-            os.remove(sc_filepath)
         if structure_controls.local_file_structure_controls:
             sc_filepath = structure_controls.local_file_structure_controls
             sc_file_name = os.path.basename(sc_filepath)
@@ -332,50 +519,18 @@ class SimulationRunner(QRunnable):
                 values.append(value)
 
             upload_data = {"node_ids": nodes_ids, "values": values}
-
-            write_json_data(upload_data, INITIAL_WATERLEVELS_TEMPLATE)
-
-            # Steps to upload initial 1D water levels file
-            # Step 1: Create a new initial water level instance for this model
-            initial_waterlevel_instance = create_initial_water_level(
-                self.threedi_api, threedimodel_id, dimension="one_d"
-            )
-            initial_waterlevel_id = initial_waterlevel_instance.id
-            # Step 2: Create an upload instance for the initial waterl level
-            filename = f"{initial_waterlevel_id}_{sim_name}_1d_initial_waterlevels.json"
-            initial_waterlevel_upload = upload_initial_water_level(
-                self.threedi_api,
-                threedimodel_id,
-                initial_waterlevel_id,
-                filename=filename,
+            # Simulations of the same batch upload identical water levels only once
+            upload_data_digest = water_levels_digest(nodes_ids, values)
+            initial_waterlevel_id = self.shared_artifacts.get_or_create(
+                ("initial_waterlevel", threedimodel_id, upload_data_digest),
+                partial(
+                    self.upload_initial_1d_water_levels,
+                    threedimodel_id,
+                    sim_name,
+                    upload_data,
+                    upload_data_digest,
+                ),
             )
-            upload_local_file(initial_waterlevel_upload, INITIAL_WATERLEVELS_TEMPLATE)
-            # Step 3: Wait for the data to be processed (initial_waterlevel.state == "valid")
-            for ti in range(int(self.upload_timeout // 2)):
-                uploaded_initial_waterlevel = fetch_model_initial_waterlevel(
-                    self.threedi_api, threedimodel_id, initial_waterlevel_id
-                )
-                if uploaded_initial_waterlevel.state == ThreediFileState.VALID.value:
-                    break
-                elif (
-                    uploaded_initial_waterlevel.state == ThreediFileState.INVALID.value
-                ):
-                    state_detail = (
-                        str(uploaded_initial_waterlevel.state_detail)
-                        .strip("{}")
-                        .strip()
-                    )
-                    err_msg = f"Failed to upload Initial Waterlevel file due to the following reasons: {state_detail}"
-                    raise SimulationRunnerError(err_msg)
-                else:
-                    time.sleep(2)
-
-            if uploaded_initial_waterlevel.state != ThreediFileState.VALID.value:
-                state_detail = (
-                    str(uploaded_initial_waterlevel.state_detail).strip("{}").strip()
-                )
-                err_msg = f"Failed to upload Initial Waterlevel file due to the following reasons: {state_detail}"
-                raise SimulationRunnerError(err_msg)
 
         # Step 4: Find & delete existing 1D water levels file of the simulation
         water_level_1d_files = fetch_simulation_initial_1d_water_level_files(
@@ -604,9 +759,9 @@ class SimulationRunner(QRunnable):
         #             )
 
         #             # now write and upload the data (in json format)
-        #             write_json_data(local_data, INITIAL_CONCENTRATIONS_TEMPLATE)
+        #             write_json_data(local_data, self.workspace_path(INITIAL_CONCENTRATIONS_TEMPLATE))
         #             upload_local_file(
-        #                 initial_concentration_upload, INITIAL_CONCENTRATIONS_TEMPLATE
+        #                 initial_concentration_upload, self.workspace_path(INITIAL_CONCENTRATIONS_TEMPLATE)
         #             )
 
         #             # wait until the data is processed
@@ -761,27 +916,25 @@ class SimulationRunner(QRunnable):
                         if substance_name in self.substances:
                             substance_id = self.substances[substance_name]
                             substance["substance"] = substance_id
-            write_json_data(file_lateral_values, LATERALS_FILE_TEMPLATE)
+            write_json_data(
+                file_lateral_values, self.workspace_path(LATERALS_FILE_TEMPLATE)
+            )
             filename = f"{sim_name}_laterals.json"
             upload_event_file = self.tc.create_simulation_lateral_file(
                 sim_id, filename=filename, offset=0
             )
-            upload_local_file(upload_event_file, LATERALS_FILE_TEMPLATE)
-            for ti in range(int(self.upload_timeout // 2)):
-                lateral_files = self.tc.fetch_lateral_files(sim_id)
-                uploaded_lateral = next(
-                    (file for file in lateral_files if file.periodic != "daily"), None
-                )
-                if uploaded_lateral.state == ThreediFileState.VALID.value:
-                    break
-                elif uploaded_lateral.state == ThreediFileState.INVALID.value:
-                    state_detail = (
-                        str(uploaded_lateral.state_detail).strip("{}").strip()
-                    )
-                    err_msg = f"Failed to upload Laterals file due to the following reasons: {state_detail}"
-                    raise SimulationRunnerError(err_msg)
-                else:
-                    time.sleep(2)
+            upload_local_file(
+                upload_event_file, self.workspace_path(LATERALS_FILE_TEMPLATE)
+            )
+            self.wait_for_file_processing(
+                lambda: next(
+                    file
+                    for file in self.tc.fetch_lateral_files(sim_id)
+                    if file.periodic != "daily"
+                ),
+                f"simulation:{sim_id}",
+                "Laterals",
+            )
 
     def include_dwf(self):
         """Add Dry Weather Flow to the new simulation."""
@@ -789,7 +942,7 @@ class SimulationRunner(QRunnable):
         sim_name = self.current_simulation.name
         if self.current_simulation.dwf:
             dwf_values = list(self.current_simulation.dwf.data.values())
-            write_json_data(dwf_values, DWF_FILE_TEMPLATE)
+            write_json_data(dwf_values, self.workspace_path(DWF_FILE_TEMPLATE))
             filename = f"{sim_name}_dwf.json"
             upload_event_file = self.tc.create_simulation_lateral_file(
                 sim_id,
@@ -797,20 +950,16 @@ class SimulationRunner(QRunnable):
                 offset=0,
                 periodic="daily",
             )
-            upload_local_file(upload_event_file, DWF_FILE_TEMPLATE)
-            for ti in range(int(self.upload_timeout // 2)):
-                lateral_files = self.tc.fetch_lateral_files(sim_id)
-                uploaded_dwf = next(
-                    (file for file in lateral_files if file.periodic == "daily"), None
-                )
-                if uploaded_dwf.state == ThreediFileState.VALID.value:
-                    break
-                elif uploaded_dwf.state == ThreediFileState.INVALID.value:
-                    state_detail = str(uploaded_dwf.state_detail).strip("{}").strip()
-                    err_msg = f"Failed to upload Dry Weather Flow file due to the following reasons: {state_detail}"
-                    raise SimulationRunnerError(err_msg)
-                else:
-                    time.sleep(2)
+            upload_local_file(upload_event_file, self.workspace_path(DWF_FILE_TEMPLATE))
+            self.wait_for_file_processing(
+                lambda: next(
+                    file
+                    for file in self.tc.fetch_lateral_files(sim_id)
+                    if file.periodic == "daily"
+                ),
+                f"simulation:{sim_id}",
+                "Dry Weather Flow",
+            )
 
     def include_breaches(self):
         """Add breaches to the new simulation."""
@@ -994,29 +1143,52 @@ class SimulationRunner(QRunnable):
                     direction_interpolate=interpolate_direction,
                 )
 
-    def include_settings(self):
-        """Add settings to the new simulation."""
+    def settings_requests(self):
+        """Return the new simulation settings requests, they only depend on the simulation id."""
         sim_id = self.new_sim.simulation.id
-        create_simulation_settings_physical(
-            self.threedi_api, sim_id, **self.new_sim.physical_settings.to_dict()
-        )
-        create_simulation_settings_numerical(
-            self.threedi_api, sim_id, **self.new_sim.numerical_settings.to_dict()
-        )
-        create_simulation_settings_time_step(
-            self.threedi_api, sim_id, **self.new_sim.time_step_settings.to_dict()
-        )
-        if self.new_sim.water_quality_settings:
-            create_simulation_settings_water_quality(
+        requests = [
+            partial(
+                create_simulation_settings_physical,
+                self.threedi_api,
+                sim_id,
+                **self.new_sim.physical_settings.to_dict(),
+            ),
+            partial(
+                create_simulation_settings_numerical,
+                self.threedi_api,
+                sim_id,
+                **self.new_sim.numerical_settings.to_dict(),
+            ),
+            partial(
+                create_simulation_settings_time_step,
                 self.threedi_api,
                 sim_id,
-                **self.new_sim.water_quality_settings.to_dict(),
+                **self.new_sim.time_step_settings.to_dict(),
+            ),
+        ]
+        if self.new_sim.water_quality_settings:
+            requests.append(
+                partial(
+                    create_simulation_settings_water_quality,
+                    self.threedi_api,
+                    sim_id,
+                    **self.new_sim.water_quality_settings.to_dict(),
+                )
             )
-
         for aggregation_settings in self.new_sim.aggregation_settings:
-            create_simulation_settings_aggregation(
-                self.threedi_api, sim_id, **aggregation_settings.to_dict()
+            requests.append(
+                partial(
+                    create_simulation_settings_aggregation,
+                    self.threedi_api,
+                    sim_id,
+                    **aggregation_settings.to_dict(),
+                )
             )
+        return requests
+
+    def include_settings(self):
+        """Add settings to the new simulation."""
+        self.submit_concurrently(self.settings_requests())
 
     def include_lizard_post_processing(self):
         """Add post-processing in Lizard to the new simulation."""
@@ -1094,42 +1266,43 @@ class SimulationRunner(QRunnable):
     def run(self):
         """Run new simulation."""
         try:
-            self.report_progress(increase_current_step=False)
-            self.create_simulation()
-            self.report_progress()
-            # self.include_init_options()
-            # self.report_progress()
-            # self.include_substances()
-            # self.report_progress()
-            # self.include_boundary_conditions()
-            # self.report_progress()
-            # self.include_structure_controls()
-            # self.report_progress()
-            self.include_initial_conditions()
-            self.report_progress()
-            # self.include_laterals()
-            # self.report_progress()
-            # self.include_dwf()
-            # self.report_progress()
-            # self.include_breaches()
-            # self.report_progress()
-            # self.include_precipitation()
-            # self.report_progress()
-            # self.include_wind()
-            # self.report_progress()
-            self.include_settings()
-            self.report_progress()
-            # self.include_new_saved_state()
-            # self.report_progress()
-            # self.include_lizard_post_processing()
-            self.report_progress()
-            template_id = self.start_simulation()
-            self.report_progress(simulation_initialized=True)
-            msg = f"Simulations successfully initialized!"
-            if template_id:
-                msg += f" Created template ID: {template_id}"
-
-            self.report_finished(msg)
+            # Each run gets its own workspace, so runners don't overwrite each other's files
+            with tempfile.TemporaryDirectory(prefix=WORKSPACE_PREFIX) as workspace:
+                self.workspace = workspace
+                self.report_progress(increase_current_step=False)
+                self.create_simulation()
+                self.report_progress()
+                # Substances need to exist before laterals and boundary conditions refer to them
+                # self.include_substances()
+                # self.report_progress()
+                # Remaining events and settings only need the simulation id
+                independent_steps = [
+                    # self.include_init_options,
+                    # self.include_boundary_conditions,
+                    # self.include_structure_controls,
+                    self.include_initial_conditions,
+                    # self.include_laterals,
+                    # self.include_dwf,
+                    # self.include_breaches,
+                    # self.include_precipitation,
+                    # self.include_wind,
+                    # self.include_new_saved_state,
+                    # self.include_lizard_post_processing,
+                ]
+                requests = independent_steps + self.settings_requests()
+                # Requests together take three progress steps, reported as they complete
+                self.submit_concurrently(
+                    requests,
+                    on_done=partial(self.report_progress, steps=3 / len(requests)),
+                )
+                # Simulation needs to be fully built before it is started
+                template_id = self.start_simulation()
+                self.report_progress(simulation_initialized=True)
+                msg = f"Simulations successfully initialized!"
+                if template_id:
+                    msg += f" Created template ID: {template_id}"
+
+                self.report_finished(msg)
         except ApiException as e:
             error_msg = extract_error_message(e)
             self.report_failure(error_msg)
@@ -1138,11 +1311,13 @@ class SimulationRunner(QRunnable):
             error_msg = f"Error: {e}"
             self.report_failure(error_msg)
 
-    def report_progress(self, simulation_initialized=False, increase_current_step=True):
+    def report_progress(
+        self, simulation_initialized=False, increase_current_step=True, steps=1
+    ):
         """Report worker progress."""
         current_progress = int(self.current_step * self.percentage_per_step)
         if increase_current_step:
-            self.current_step += 1
+            self.current_step += steps
         self.signals.initializing_simulations_progress.emit(
             self.new_sim,
             simulation_initialized,
@@ -1164,3 +1339,79 @@ class SimulationRunner(QRunnable):
             collection[i : i + chunk_length]
             for i in range(0, len(collection), chunk_length)
         ]
+
+
+class SimulationBatchRunner(QRunnable):
+    """Worker object responsible for running multiple simulations at once."""
+
+    def __init__(
+        self,
+        threedi_api,
+        new_sims,
+        upload_timeout=900,
+        max_workers=SIMULATION_BATCH_MAX_WORKERS,
+    ):
+        super().__init__()
+        self.threedi_api = threedi_api
+        self.new_sims = new_sims
+        self.upload_timeout = upload_timeout
+        self.max_workers = max_workers
+        self.signals = SimulationRunnerSignals()
+        self.shared_artifacts = SharedArtifacts()
+        self.progress_lock = threading.Lock()
+        self.simulations_progress = {}
+        self.failed_simulations = []
+
+    def create_runner(self, new_sim):
+        """Create runner of the single simulation reporting to this batch."""
+        runner = SimulationRunner(
+            self.threedi_api,
+            new_sim,
+            upload_timeout=self.upload_timeout,
+            shared_artifacts=self.shared_artifacts,
+        )
+        # Runners are executed in the batch threads, so their signals are handled in place
+        runner.signals.initializing_simulations_progress.connect(
+            partial(self.on_simulation_progress, runner), Qt.DirectConnection
+        )
+        runner.signals.initializing_simulations_failed.connect(
+            partial(self.on_simulation_failed, runner), Qt.DirectConnection
+        )
+        return runner
+
+    def on_simulation_progress(
+        self, runner, new_sim, simulation_initialized, current_progress, total_progress
+    ):
+        """Combine progress of all simulations and report it."""
+        if simulation_initialized:
+            current_progress = total_progress
+        with self.progress_lock:
+            self.simulations_progress[id(runner)] = current_progress
+            batch_progress = sum(self.simulations_progress.values())
+        self.signals.initializing_simulations_progress.emit(
+            new_sim,
+            simulation_initialized,
+            batch_progress,
+            runner.total_progress * len(self.new_sims),
+        )
+
+    def on_simulation_failed(self, runner, error_message):
+        """Report failure of the single simulation, the rest of the batch continues."""
+        sim_name = runner.new_sim.simulation.name
+        with self.progress_lock:
+            self.failed_simulations.append(sim_name)
+        self.signals.initializing_simulations_failed.emit(
+            f"Simulation {sim_name} failed: {error_message}"
+        )
+
+    @pyqtSlot()
+    def run(self):
+        """Run new simulations."""
+        runners = [self.create_runner(new_sim) for new_sim in self.new_sims]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for runner in runners:
+                executor.submit(runner.run)
+        initialized_number = len(self.new_sims) - len(self.failed_simulations)
+        if initialized_number:
+            msg = f"{initialized_number} out of {len(self.new_sims)} simulations successfully initialized!"
+            self.signals.initializing_simulations_finished.emit(msg)
@@ -7,10 +7,12 @@ from qgis.PyQt.QtCore import QByteArray, QObject, QUrl, pyqtSignal, pyqtSlot
 from qgis.PyQt.QtNetwork import QNetworkRequest
 from threedi_api_client.openapi import ApiException
 
+from threedi_models_simulations.utils.polling import notify
 from threedi_models_simulations.utils.threedi_api import (
     SimulationStatusName,
     extract_error_message,
     fetch_simulation_statuses,
+    fetch_simulation_statuses_pages,
 )
 from threedi_models_simulations.widgets.simulation_results_dialog import (
     API_DATETIME_FORMAT,
@@ -44,30 +46,30 @@ class SimulationProgressWorker(QObject):
         self.start_listening()
 
     def fetch_finished_simulations(self):
-        """Fetches finished simulations data."""
+        """Fetches finished simulations data, emitting it page by page as it arrives."""
         try:
-            finished_simulations_statuses = fetch_simulation_statuses(
+            time.sleep(1)
+            for finished_simulations_statuses in fetch_simulation_statuses_pages(
                 self.threedi_api, name=SimulationStatusName.FINISHED.value
-            )
-            if self.model_id:
-                finished_simulations_statuses = (
-                    status
+            ):
+                if self.model_id:
+                    finished_simulations_statuses = (
+                        status
+                        for status in finished_simulations_statuses
+                        if status.threedimodel_id == self.model_id
+                    )
+                finished_simulations_data = {
+                    status.simulation_id: {
+                        "date_created": status.created.strftime(API_DATETIME_FORMAT),
+                        "name": status.simulation_name,
+                        "progress": 100,
+                        "status": status.name,
+                        "simulation_user_first_name": status.simulation_user_first_name,
+                        "simulation_user_last_name": status.simulation_user_last_name,
+                    }
                     for status in finished_simulations_statuses
-                    if status.threedimodel_id == self.model_id
-                )
-            finished_simulations_data = {
-                status.simulation_id: {
-                    "date_created": status.created.strftime(API_DATETIME_FORMAT),
-                    "name": status.simulation_name,
-                    "progress": 100,
-                    "status": status.name,
-                    "simulation_user_first_name": status.simulation_user_first_name,
-                    "simulation_user_last_name": status.simulation_user_last_name,
                 }
-                for status in finished_simulations_statuses
-            }
-            time.sleep(1)
-            self.simulation_finished.emit(finished_simulations_data)
+                self.simulation_finished.emit(finished_simulations_data)
         except ApiException as e:
             error_msg = extract_error_message(e)
             self.thread_failed.emit(error_msg)
@@ -140,6 +142,7 @@ class SimulationProgressWorker(QObject):
             status_name = data["data"]["status"]
             sim_data = self.running_simulations[sim_id]
             sim_data["status"] = status_name
+            notify(f"simulation:{sim_id}")
             if status_name == SimulationStatusName.FINISHED.value:
                 if sim_data["progress"] == 100:
                     statuses = {
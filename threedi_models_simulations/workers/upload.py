@@ -1,13 +1,21 @@
+import json
 import os
-import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from enum import Enum
 from functools import partial
 
 from qgis.PyQt.QtCore import QByteArray, QObject, QRunnable, QUrl, pyqtSignal, pyqtSlot
-from threedi_api_client.files import upload_file
+from threedi_api_client.openapi import ApiException
 
-from threedi_models_simulations.constants import UPLOAD_CHUNK_SIZE
-from threedi_models_simulations.utils.file import zip_into_archive
+from threedi_models_simulations.constants import (
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_MAX_WORKERS,
+    UPLOAD_STATES_DIR,
+)
+from threedi_models_simulations.utils.file import cached_archive, remove_cached_archive
+from threedi_models_simulations.utils.polling import PollTimeoutError, wait_for
 from threedi_models_simulations.utils.threedi_api import (
     FileState,
     SchematisationApiMapper,
@@ -27,12 +35,71 @@ from threedi_models_simulations.utils.threedi_api import (
     upload_schematisation_revision,
     upload_schematisation_revision_raster,
 )
+from threedi_models_simulations.utils.transfer import TransferCanceled, upload_file
 
 
 class RevisionUploadError(Exception):
     pass
 
 
+class SchematisationUploadState:
+    """On-disk record of the finished tasks of an uncommitted revision upload."""
+
+    def __init__(self, schematisation_id):
+        self.state_path = os.path.join(
+            UPLOAD_STATES_DIR, f"schematisation_{schematisation_id}.json"
+        )
+        self.revision_id = None
+        self.finished_tasks = {}
+        self.lock = threading.Lock()
+        try:
+            with open(self.state_path, "r") as state_file:
+                state = json.load(state_file)
+            self.revision_id = state["revision_id"]
+            self.finished_tasks = state["finished_tasks"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(self):
+        os.makedirs(UPLOAD_STATES_DIR, exist_ok=True)
+        tmp_state_path = f"{self.state_path}.tmp"
+        with open(tmp_state_path, "w") as state_file:
+            json.dump(
+                {
+                    "revision_id": self.revision_id,
+                    "finished_tasks": self.finished_tasks,
+                },
+                state_file,
+            )
+        os.replace(tmp_state_path, self.state_path)
+
+    def start_revision(self, revision_id):
+        """Start recording tasks of the new revision upload."""
+        with self.lock:
+            self.revision_id = revision_id
+            self.finished_tasks = {}
+            self.save()
+
+    def task_finished(self, task_name, file_signature=None):
+        """Record finished task with signature of the uploaded file."""
+        with self.lock:
+            self.finished_tasks[task_name] = {"signature": file_signature}
+            self.save()
+
+    def is_task_finished(self, task_name, file_signature=None):
+        """Check if task was finished for the unchanged file."""
+        task_state = self.finished_tasks.get(task_name)
+        return task_state is not None and task_state["signature"] == file_signature
+
+    def clear(self):
+        """Remove the state after the revision was committed."""
+        with self.lock:
+            self.revision_id = None
+            self.finished_tasks = {}
+            if os.path.exists(self.state_path):
+                os.remove(self.state_path)
+
+
 class UploadWorkerSignals(QObject):
     """Separate object for signals as QRunnable is not a QObject."""
 
@@ -52,15 +119,24 @@ class SchematisationUploadWorker(QRunnable):
     UPLOAD_CHECK_RETRIES = 15
     TASK_CHECK_INTERVAL = 2.5
     TASK_CHECK_RETRIES = 4
+    REVISION_VALIDATION_TIMEOUT = 1800
+    MODEL_CHECKER_TIMEOUT = 1800
+    MODEL_TASKS_TIMEOUT = 3600
 
     def __init__(
-        self, threedi_api, local_schematisation, upload_specification, upload_row_number
+        self,
+        threedi_api,
+        local_schematisation,
+        upload_specification,
+        upload_row_number,
+        max_workers=UPLOAD_MAX_WORKERS,
     ):
         super().__init__()
         self.threedi_api = threedi_api
         self.local_schematisation = local_schematisation
         self.upload_specification = upload_specification
         self.upload_row_number = upload_row_number
+        self.max_workers = max_workers
         self.current_task = "NO TASK"
         self.current_task_progress = 0
         self.total_progress = 0
@@ -68,6 +144,12 @@ class SchematisationUploadWorker(QRunnable):
         self.revision = self.upload_specification["latest_revision"]
         self.signals = UploadWorkerSignals()
         self.upload_canceled = False
+        self.tasks_aborted = threading.Event()
+        self.progress_lock = threading.Lock()
+        self.task_context = threading.local()
+        self.tasks_progress = {}
+        self.running_tasks = {}
+        self.upload_state = SchematisationUploadState(self.schematisation.id)
 
     def stop_upload_tasks(self):
         """Mark the upload task as canceled."""
@@ -76,8 +158,8 @@ class SchematisationUploadWorker(QRunnable):
     @pyqtSlot()
     def run(self):
         """Run all schematisation upload tasks."""
-        tasks_list = self.build_tasks_list()
-        if not tasks_list:
+        tasks_graph = self.build_tasks_graph()
+        if not tasks_graph:
             self.current_task = "DONE"
             self.current_task_progress = 100
             self.total_progress = 100
@@ -86,31 +168,127 @@ class SchematisationUploadWorker(QRunnable):
                 self.upload_row_number, "Nothing to upload or process"
             )
             return
-        progress_per_task = int(1 / len(tasks_list) * 100)
         try:
-            for i, task in enumerate(tasks_list, start=1):
-                if self.upload_canceled:
-                    self.signals.canceled.emit(self.upload_row_number)
-                    return
-                task()
-                self.total_progress = progress_per_task * i
+            finished_tasks = self.resume_upload(tasks_graph)
+        except Exception as e:
+            self.signals.failed.emit(self.upload_row_number, f"Error: {e}")
+            return
+        self.tasks_progress = {
+            task_name: 100 if task_name in finished_tasks else 0
+            for task_name in tasks_graph
+        }
+        pending_tasks = {
+            task_name: task_info
+            for task_name, task_info in tasks_graph.items()
+            if task_name not in finished_tasks
+        }
+        running_futures = {}
+        error_msg = None
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending_tasks or running_futures:
+                if not self.upload_canceled and not self.tasks_aborted.is_set():
+                    for task_name, (task, dependencies) in list(pending_tasks.items()):
+                        if dependencies <= finished_tasks:
+                            future = executor.submit(self.run_task, task_name, task)
+                            running_futures[future] = task_name
+                            del pending_tasks[task_name]
+                if not running_futures:
+                    break
+                done_futures, _ = wait(running_futures, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    task_name = running_futures.pop(future)
+                    try:
+                        future.result()
+                        finished_tasks.add(task_name)
+                    except TransferCanceled:
+                        pass
+                    except Exception as e:
+                        if error_msg is None:
+                            error_msg = f"Error: {e}"
+                        self.tasks_aborted.set()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if error_msg is not None:
+            self.signals.failed.emit(self.upload_row_number, error_msg)
+        elif self.upload_canceled:
+            self.signals.canceled.emit(self.upload_row_number)
+        else:
             self.current_task = "DONE"
             self.total_progress = 100
             self.report_upload_progress()
             msg = f"Schematisation '{self.schematisation.name}' (revision: {self.revision.number}) files uploaded"
             self.signals.finished.emit(self.upload_row_number, msg)
-        except Exception as e:
-            error_msg = f"Error: {e}"
-            self.signals.failed.emit(self.upload_row_number, error_msg)
 
-    def build_tasks_list(self):
-        """Build upload tasks list."""
-        tasks = list()
+    def run_task(self, task_name, task):
+        """Run single task from the tasks graph."""
+        self.task_context.name = task_name
+        try:
+            task()
+        finally:
+            with self.progress_lock:
+                self.running_tasks.pop(task_name, None)
+        if task_name == "create_revision":
+            self.upload_state.start_revision(self.revision.id)
+        elif task_name == "commit_revision":
+            self.upload_state.clear()
+            geopackage = self.upload_specification["selected_files"].get("geopackage")
+            if geopackage and geopackage["make_action"]:
+                remove_cached_archive(geopackage["filepath"])
+        elif task_name != "create_3di_model":
+            file_signature = self.task_file_signature(task_name)
+            self.upload_state.task_finished(task_name, file_signature)
+
+    def task_file_signature(self, task_name):
+        """Return size and modification time of the file uploaded by the task."""
+        if not task_name.startswith("upload_"):
+            return None
+        file_name = task_name.split("_", 1)[1]
+        file_path = self.upload_specification["selected_files"][file_name]["filepath"]
+        file_stat = os.stat(file_path)
+        return [file_stat.st_size, file_stat.st_mtime_ns]
+
+    def resume_upload(self, tasks_graph):
+        """Reuse uncommitted revision of the interrupted upload, return names of the already finished tasks."""
+        resumable_revision_id = self.upload_state.revision_id
+        if resumable_revision_id is None:
+            return set()
+        if (
+            "create_revision" not in tasks_graph
+            and resumable_revision_id != self.revision.id
+        ):
+            return set()
+        try:
+            revision = fetch_schematisation_revision(
+                self.threedi_api, self.schematisation.id, resumable_revision_id
+            )
+        except ApiException:
+            revision = None
+        if revision is None or revision.commit_date is not None or revision.archived:
+            self.upload_state.clear()
+            return set()
+        self.revision = revision
+        finished_tasks = {"create_revision"} & set(tasks_graph)
+        for task_name in tasks_graph:
+            if task_name in {"create_revision", "commit_revision", "create_3di_model"}:
+                continue
+            if self.upload_state.is_task_finished(
+                task_name, self.task_file_signature(task_name)
+            ):
+                finished_tasks.add(task_name)
+        return finished_tasks
+
+    def build_tasks_graph(self):
+        """Build upload tasks graph (task name -> task and names of the tasks it depends on)."""
+        tasks = OrderedDict()
         create_revision = self.upload_specification["create_revision"]
         make_3di_model = self.upload_specification["make_3di_model"]
         inherit_templates = self.upload_specification["cb_inherit_templates"]
+        revision_dependencies = set()
         if create_revision:
-            tasks.append(self.create_revision_task)
+            tasks["create_revision"] = (self.create_revision_task, set())
+            revision_dependencies.add("create_revision")
+        files_tasks = set()
         for file_name, file_state in self.upload_specification[
             "selected_files"
         ].items():
@@ -118,46 +296,54 @@ class SchematisationUploadWorker(QRunnable):
             file_status = file_state["status"]
             if make_action_on_file is False:
                 continue
+            if file_name == "geopackage":
+                delete_task = self.delete_schematisation_task
+                upload_task = self.upload_schematisation_task
+            else:
+                delete_task = partial(self.delete_raster_task, file_name)
+                upload_task = partial(self.upload_raster_task, file_name)
+            delete_task_name = f"delete_{file_name}"
+            upload_task_name = f"upload_{file_name}"
             if file_status == UploadFileStatus.NEW:
-                if file_name == "geopackage":
-                    tasks.append(self.upload_schematisation_task)
-                else:
-                    tasks.append(partial(self.upload_raster_task, file_name))
+                tasks[upload_task_name] = (upload_task, set(revision_dependencies))
+                files_tasks.add(upload_task_name)
             elif file_status == UploadFileStatus.CHANGES_DETECTED:
-                if file_name == "geopackage":
-                    tasks.append(self.delete_schematisation_task)
-                    tasks.append(self.upload_schematisation_task)
-                else:
-                    tasks.append(partial(self.delete_raster_task, file_name))
-                    tasks.append(partial(self.upload_raster_task, file_name))
+                tasks[delete_task_name] = (delete_task, set(revision_dependencies))
+                tasks[upload_task_name] = (
+                    upload_task,
+                    revision_dependencies | {delete_task_name},
+                )
+                files_tasks.update({delete_task_name, upload_task_name})
             elif file_status == UploadFileStatus.DELETED_LOCALLY:
-                tasks.append(partial(self.delete_raster_task, file_name))
+                tasks[delete_task_name] = (delete_task, set(revision_dependencies))
+                files_tasks.add(delete_task_name)
             else:
                 continue
-        tasks.append(self.commit_revision_task)
+        tasks["commit_revision"] = (
+            self.commit_revision_task,
+            revision_dependencies | files_tasks,
+        )
         if make_3di_model:
-            tasks.append(partial(self.create_3di_model_task, inherit_templates))
+            tasks["create_3di_model"] = (
+                partial(self.create_3di_model_task, inherit_templates),
+                {"commit_revision"},
+            )
         return tasks
 
     def create_revision_task(self):
         """Run creation of the new revision task."""
-        self.current_task = "CREATE REVISION"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress("CREATE REVISION")
         self.revision = create_schematisation_revision(
             self.threedi_api, self.schematisation.id
         )
-        self.current_task_progress = 100
-        self.report_upload_progress()
+        self.update_task_progress(100)
 
     def upload_schematisation_task(self):
-        self.current_task = "UPLOAD SCHEMATISATION DATABASE"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress("UPLOAD SCHEMATISATION DATABASE")
         schematisation_geopackage = self.upload_specification["selected_files"][
             "geopackage"
         ]["filepath"]
-        zipped_geopackage_filepath = zip_into_archive(schematisation_geopackage)
+        zipped_geopackage_filepath, _ = cached_archive(schematisation_geopackage)
         zipped_geopackage_file_name = os.path.basename(zipped_geopackage_filepath)
         upload = upload_schematisation_revision(
             self.threedi_api,
@@ -171,25 +357,18 @@ class SchematisationUploadWorker(QRunnable):
             UPLOAD_CHUNK_SIZE,
             callback_func=self.monitor_upload_progress,
         )
-        os.remove(zipped_geopackage_filepath)
-        self.current_task_progress = 100
-        self.report_upload_progress()
+        self.update_task_progress(100)
 
     def delete_schematisation_task(self):
-        self.current_task = "DELETE SCHEMATISATION DATABASE"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress("DELETE SCHEMATISATION DATABASE")
         delete_schematisation_revision_sqlite(
             self.threedi_api, self.schematisation.id, self.revision.id
         )
-        self.current_task_progress = 100
-        self.report_upload_progress()
+        self.update_task_progress(100)
 
     def upload_raster_task(self, raster_type):
         """Run raster file upload task."""
-        self.current_task = f"UPLOAD RASTER ({raster_type})"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress(f"UPLOAD RASTER ({raster_type})")
         raster_filepath = self.upload_specification["selected_files"][raster_type][
             "filepath"
         ]
@@ -214,8 +393,7 @@ class SchematisationUploadWorker(QRunnable):
             UPLOAD_CHUNK_SIZE,
             callback_func=self.monitor_upload_progress,
         )
-        self.current_task_progress = 100
-        self.report_upload_progress()
+        self.update_task_progress(100)
 
     def delete_raster_task(self, raster_type):
         """Run raster file deletion task."""
@@ -224,9 +402,7 @@ class SchematisationUploadWorker(QRunnable):
             types_to_delete.append(
                 "dem_raw_file"
             )  # We need to remove legacy 'dem_raw_file` as well
-        self.current_task = f"DELETE RASTER ({raster_type})"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress(f"DELETE RASTER ({raster_type})")
         for revision_raster in self.revision.rasters:
             revision_raster_type = revision_raster.type
             if revision_raster_type in types_to_delete:
@@ -237,16 +413,15 @@ class SchematisationUploadWorker(QRunnable):
                     self.revision.id,
                 )
                 break
-        self.current_task_progress = 100
-        self.report_upload_progress()
+        self.update_task_progress(100)
 
     def commit_revision_task(self):
         """Run committing revision task."""
-        self.current_task = "COMMIT REVISION"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress("COMMIT REVISION")
         commit_ready_file_states = {FileState.UPLOADED, FileState.PROCESSED}
-        for i in range(self.UPLOAD_CHECK_RETRIES):
+        revision_resource = f"revision:{self.revision.id}"
+
+        def check_revision_files_ready():
             before_commit_revision = fetch_schematisation_revision(
                 self.threedi_api, self.schematisation.id, self.revision.id
             )
@@ -258,12 +433,20 @@ class SchematisationUploadWorker(QRunnable):
                 file_state in commit_ready_file_states
                 for file_state in revision_file_states
             ):
-                break
+                return True
             elif FileState.ERROR in revision_file_states:
                 err = RevisionUploadError("Processing of the uploaded files failed!")
                 raise err
-            else:
-                time.sleep(self.UPLOAD_CHECK_INTERVAL)
+            return None
+
+        try:
+            wait_for(
+                check_revision_files_ready,
+                revision_resource,
+                timeout=self.UPLOAD_CHECK_INTERVAL * self.UPLOAD_CHECK_RETRIES,
+            )
+        except PollTimeoutError:
+            pass  # Let the API decide if the revision can be committed
         commit_message = self.upload_specification["commit_message"]
         commit_schematisation_revision(
             self.threedi_api,
@@ -271,55 +454,81 @@ class SchematisationUploadWorker(QRunnable):
             self.revision.id,
             commit_message=commit_message,
         )
-        self.revision = fetch_schematisation_revision(
-            self.threedi_api, self.schematisation.id, self.revision.id
-        )
-        while self.revision.is_valid is None:
-            time.sleep(2)
-            self.revision = fetch_schematisation_revision(
+
+        def check_revision_validated():
+            revision = fetch_schematisation_revision(
                 self.threedi_api, self.schematisation.id, self.revision.id
             )
-        self.current_task_progress = 100
-        self.report_upload_progress()
+            return revision if revision.is_valid is not None else None
+
+        try:
+            self.revision = wait_for(
+                check_revision_validated,
+                revision_resource,
+                timeout=self.REVISION_VALIDATION_TIMEOUT,
+            )
+        except PollTimeoutError:
+            err = RevisionUploadError(
+                f"Revision validation didn't finish within {self.REVISION_VALIDATION_TIMEOUT} seconds."
+            )
+            raise err
+        self.update_task_progress(100)
         self.local_schematisation.update_wip_revision(self.revision.number)
         self.signals.revision_committed.emit()
 
     def create_3di_model_task(self, inherit_templates=False):
         """Run creation of the new model out of revision data."""
-        self.current_task = "MAKE 3DI MODEL"
-        self.current_task_progress = 0
-        self.report_upload_progress()
+        self.start_task_progress("MAKE 3DI MODEL")
         # Wait for the 'modelchecker' validations
-        model_checker_task = None
-        revision_tasks = fetch_schematisation_revision_tasks(
-            self.threedi_api, self.schematisation.id, self.revision.id
-        )
-        for i in range(self.TASK_CHECK_RETRIES):
-            for rtask in revision_tasks:
-                if rtask.name == "modelchecker":
-                    model_checker_task = rtask
-                    break
-            if model_checker_task:
-                break
-            else:
-                time.sleep(self.TASK_CHECK_INTERVAL)
+        revision_resource = f"revision:{self.revision.id}"
+
+        def find_model_checker_task():
+            revision_tasks = fetch_schematisation_revision_tasks(
+                self.threedi_api, self.schematisation.id, self.revision.id
+            )
+            return next(
+                (rtask for rtask in revision_tasks if rtask.name == "modelchecker"),
+                None,
+            )
+
+        try:
+            model_checker_task = wait_for(
+                find_model_checker_task,
+                revision_resource,
+                timeout=self.TASK_CHECK_INTERVAL * self.TASK_CHECK_RETRIES,
+                initial_interval=self.TASK_CHECK_INTERVAL,
+            )
+        except PollTimeoutError:
+            model_checker_task = None
         if model_checker_task:
-            status = model_checker_task.status
-            while status != ThreediModelTaskStatus.SUCCESS.value:
-                model_checker_task = fetch_schematisation_revision_task(
+
+            def check_model_checker_finished():
+                task = fetch_schematisation_revision_task(
                     self.threedi_api,
                     model_checker_task.id,
                     self.schematisation.id,
                     self.revision.id,
                 )
-                status = model_checker_task.status
-                if status == ThreediModelTaskStatus.SUCCESS.value:
-                    break
-                elif status == ThreediModelTaskStatus.FAILURE.value:
-                    err = RevisionUploadError(model_checker_task.detail["message"])
+                if task.status == ThreediModelTaskStatus.SUCCESS.value:
+                    return task
+                elif task.status == ThreediModelTaskStatus.FAILURE.value:
+                    err = RevisionUploadError(task.detail["message"])
+                    raise err
+                return None
+
+            if model_checker_task.status != ThreediModelTaskStatus.SUCCESS.value:
+                try:
+                    model_checker_task = wait_for(
+                        check_model_checker_finished,
+                        revision_resource,
+                        timeout=self.MODEL_CHECKER_TIMEOUT,
+                        initial_interval=self.TASK_CHECK_INTERVAL,
+                    )
+                except PollTimeoutError:
+                    err = RevisionUploadError(
+                        f"Schematisation checks didn't finish within {self.MODEL_CHECKER_TIMEOUT} seconds."
+                    )
                     raise err
-                else:
-                    time.sleep(self.TASK_CHECK_INTERVAL)
             checker_errors = model_checker_task.detail["result"]["errors"]
             if checker_errors:
                 error_msg = "\n".join(error["description"] for error in checker_errors)
@@ -342,7 +551,8 @@ class SchematisationUploadWorker(QRunnable):
             "make_simulation_templates": False,
         }
         expected_tasks_number = len(finished_tasks)
-        while not all(finished_tasks.values()):
+
+        def check_model_tasks_finished():
             model_tasks = fetch_model_tasks(self.threedi_api, model_id)
             for task in model_tasks:
                 task_status = task.status
@@ -351,15 +561,25 @@ class SchematisationUploadWorker(QRunnable):
                 elif task_status == ThreediModelTaskStatus.FAILURE.value:
                     err = RevisionUploadError(task.detail["message"])
                     raise err
-            model = fetch_model(self.threedi_api, model_id)
+            model = fetch_model.uncached(self.threedi_api, model_id)
             if getattr(model, "is_valid", False):
-                finished_tasks = {
-                    task_name: True for task_name in finished_tasks.keys()
-                }
+                finished_tasks.update(dict.fromkeys(finished_tasks, True))
             finished_tasks_count = len([val for val in finished_tasks.values() if val])
             self.monitor_upload_progress(finished_tasks_count, expected_tasks_number)
-            if finished_tasks_count != expected_tasks_number:
-                time.sleep(self.TASK_CHECK_INTERVAL)
+            return True if finished_tasks_count == expected_tasks_number else None
+
+        try:
+            wait_for(
+                check_model_tasks_finished,
+                f"model:{model_id}",
+                timeout=self.MODEL_TASKS_TIMEOUT,
+                initial_interval=self.TASK_CHECK_INTERVAL,
+            )
+        except PollTimeoutError:
+            err = RevisionUploadError(
+                f"3Di model tasks didn't finish within {self.MODEL_TASKS_TIMEOUT} seconds."
+            )
+            raise err
 
     def report_upload_progress(self):
         """Report upload progress."""
@@ -370,8 +590,36 @@ class SchematisationUploadWorker(QRunnable):
             self.total_progress,
         )
 
+    def start_task_progress(self, task_label):
+        """Register the task of the current thread as running."""
+        with self.progress_lock:
+            self.running_tasks[self.task_context.name] = task_label
+        self.update_task_progress(0)
+
+    def update_task_progress(self, task_progress):
+        """Combine progress of all tasks and report it, stop the task if the upload was canceled."""
+        # Finished tasks are reported even when the upload was canceled in the meantime
+        if task_progress < 100 and (
+            self.upload_canceled or self.tasks_aborted.is_set()
+        ):
+            raise TransferCanceled("Upload canceled")
+        with self.progress_lock:
+            self.tasks_progress[self.task_context.name] = task_progress
+            running_tasks = [
+                (task_label, self.tasks_progress[task_name])
+                for task_name, task_label in self.running_tasks.items()
+            ]
+            if running_tasks:
+                self.current_task = ", ".join(label for label, _ in running_tasks)
+                self.current_task_progress = int(
+                    sum(progress for _, progress in running_tasks) / len(running_tasks)
+                )
+            self.total_progress = int(
+                sum(self.tasks_progress.values()) / len(self.tasks_progress)
+            )
+            self.report_upload_progress()
+
     def monitor_upload_progress(self, chunk_size, total_size):
         """Upload progress callback method."""
         upload_progress = int(chunk_size / total_size * 100)
-        self.current_task_progress = upload_progress
-        self.report_upload_progress()
+        self.update_task_progress(upload_progress)